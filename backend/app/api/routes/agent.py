@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
 import base64
 import logging
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, Any, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,17 +20,18 @@ from app.db.models import User
 from app.services.gmail import fetch_messages, list_messages
 from app.services.calendar import create_event
 from app.services.token_manager import get_valid_access_token
-from app.services.agents.router_agent import route_command
+from app.services.agents.router_agent import aroute_command
 from app.services.agents.email_agent import (
-    categorize_emails,
-    create_tldr_digest,
-    detect_subscriptions,
-    extract_todos,
+    GMAIL_INBOX_PREFIX,
+    acategorize_emails,
+    acreate_tldr_digest,
+    adetect_subscriptions,
+    aextract_todos,
 )
 
 from app.services.embedding import search_emails as semantic_search_emails
-from app.services.agents.base import call_llm
-from app.services.agents.function_calling_agent import run_agent
+from app.services.agents.base import acall_llm
+from app.services.agents.function_calling_agent import run_agent, stream_agent
 from app.services.stt import transcribe_audio
 from app.services.tts import synthesize_speech
 
@@ -113,7 +115,7 @@ def _build_sources(action: str, result: dict) -> list[dict]:
             sources.append({
                 "title": email.get("subject", "(no subject)"),
                 "description": email.get("snippet", ""),
-                "href": f"https://mail.google.com/mail/u/0/#inbox/{message_id}",
+                "href": GMAIL_INBOX_PREFIX + message_id,
             })
 
     elif action in ("summarize_emails", "create_tldr"):
@@ -156,7 +158,7 @@ async def _execute_action(
             return {}, "No recent emails found."
         messages = await fetch_messages(access_token, msg_ids, include_body=True)
         email_dicts = [_format_gmail_message(m) for m in messages if not m.is_automated_sender]
-        digest = await asyncio.to_thread(create_tldr_digest, email_dicts)
+        digest = await acreate_tldr_digest(email_dicts)
         summary = digest.get("summary", "")
         highlights = digest.get("highlights", [])
         parts = [summary] if summary else []
@@ -176,7 +178,7 @@ async def _execute_action(
             return {"emails": []}, "No recent emails found."
         messages = await fetch_messages(access_token, msg_ids, include_body=True)
         email_dicts = [_format_gmail_message(m) for m in messages]
-        categorized = await asyncio.to_thread(categorize_emails, email_dicts)
+        categorized = await acategorize_emails(email_dicts)
         needs_reply = [email_item for email_item in categorized if email_item.get("category") == "needs_reply"]
         return {"emails": categorized}, f"Found {len(categorized)} emails, {len(needs_reply)} need replies."
 
@@ -194,7 +196,7 @@ async def _execute_action(
             return {"subscriptions": []}, "No subscription-related emails found."
         messages = await fetch_messages(access_token, msg_ids, include_body=True)
         email_dicts = [_format_gmail_message(m) for m in messages]
-        subs = await asyncio.to_thread(detect_subscriptions, email_dicts)
+        subs = await adetect_subscriptions(email_dicts)
         return {"subscriptions": subs}, f"Found {len(subs)} subscriptions/bills."
 
     if action == "generate_todos":
@@ -206,7 +208,7 @@ async def _execute_action(
             return {"todos": []}, "No recent emails found to extract tasks from."
         messages = await fetch_messages(access_token, msg_ids, include_body=True)
         email_dicts = [_format_gmail_message(m) for m in messages if not m.is_automated_sender]
-        todos_result = await asyncio.to_thread(extract_todos, email_dicts)
+        todos_result = await aextract_todos(email_dicts)
         todo_count = len(todos_result.get("todos", []))
         return todos_result, f"Found {todo_count} action items from your recent emails."
 
@@ -271,7 +273,7 @@ async def agent_command(
     except Exception:
         logger.exception("Function-calling agent failed, falling back to router")
 
-    routing = await asyncio.to_thread(route_command, request.command)
+    routing = await aroute_command(request.command)
     action = routing.get("action", "unknown")
     params = routing.get("parameters", {})
 
@@ -314,6 +316,34 @@ async def agent_chat(
     }
 
 
+@router.post("/chat/stream")
+async def agent_chat_stream(
+    request: ChatRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    user: Annotated[User, Depends(require_current_user)],
+) -> StreamingResponse:
+    """Streaming chat endpoint: emits agent events as server-sent events.
+
+    Events are JSON objects with a "type" of "text" (reply delta), "tool_call",
+    "done" (final response, tool calls and conversation) or "error".
+    """
+    access_token = await get_valid_access_token(user, db)
+
+    async def event_stream():
+        async for event in stream_agent(
+            request.message,
+            access_token,
+            conversation_history=request.conversation_history,
+        ):
+            yield f"data: {orjson.dumps(event).decode()}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/voice")
 async def agent_voice(
     file: UploadFile = File(...),
@@ -346,7 +376,7 @@ async def agent_voice(
     except Exception:
         logger.exception("Function-calling agent failed for voice, falling back to router")
 
-    routing = await asyncio.to_thread(route_command, transcript)
+    routing = await aroute_command(transcript)
     action = routing.get("action", "unknown")
     params = routing.get("parameters", {})
 
@@ -398,8 +428,7 @@ async def agent_voice_chat(
         tool_calls = agent_response.tool_calls
     except Exception:
         logger.exception("Function-calling agent failed in voice-chat, falling back to plain LLM")
-        response_text = await asyncio.to_thread(
-            call_llm,
+        response_text = await acall_llm(
             (
                 "You are SaturdAI, a friendly and concise voice assistant. "
                 "Keep responses brief (1-3 sentences) and conversational. "
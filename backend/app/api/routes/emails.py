@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, Query
@@ -20,9 +19,9 @@ from app.services.gmail import (
 )
 from app.services.token_manager import get_valid_access_token
 from app.services.agents.email_agent import (
-    categorize_emails,
-    create_tldr_digest,
-    generate_reply,
+    acategorize_emails,
+    acreate_tldr_digest,
+    agenerate_reply,
 )
 
 router = APIRouter()
@@ -83,7 +82,7 @@ async def get_recent_emails(
     messages = await fetch_messages(access_token, message_ids, include_body=True)
     email_dicts = [_format_gmail_message(m) for m in messages]
 
-    categorized = await asyncio.to_thread(categorize_emails, email_dicts)
+    categorized = await acategorize_emails(email_dicts)
     return {"emails": categorized}
 
 
@@ -111,7 +110,7 @@ async def get_tldr_digest(
         if not m.is_automated_sender
     ]
 
-    digest = await asyncio.to_thread(create_tldr_digest, email_dicts)
+    digest = await acreate_tldr_digest(email_dicts)
     return digest
 
 
@@ -138,7 +137,7 @@ async def handle_reply(
         if not original:
             return {"error": "Message not found"}
         email_data = _format_gmail_message(original)
-        suggestion = await asyncio.to_thread(generate_reply, email_data, user.name or user.email)
+        suggestion = await agenerate_reply(email_data, user.name or user.email)
         return {"generated": True, "suggestion": suggestion}
 
     result = await send_reply(
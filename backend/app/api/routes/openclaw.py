@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import secrets
 from datetime import datetime
 from typing import Annotated, Optional
@@ -17,7 +16,7 @@ from app.db import get_db
 from app.db.models import User
 from app.services.gmail import fetch_message, send_reply
 from app.services.token_manager import get_valid_access_token
-from app.services.agents.email_agent import generate_reply
+from app.services.agents.email_agent import agenerate_reply
 
 router = APIRouter()
 settings = load_settings()
@@ -125,7 +124,7 @@ async def openclaw_reply_draft(
         raise HTTPException(status_code=404, detail="Message not found")
 
     email_data = emails._format_gmail_message(original)
-    suggestion = await asyncio.to_thread(generate_reply, email_data, user.name or user.email)
+    suggestion = await agenerate_reply(email_data, user.name or user.email)
     return {"generated": True, "suggestion": suggestion}
 
 
@@ -14,7 +14,7 @@ from app.db import get_db
 from app.db.models import Todo, User
 from app.services.gmail import fetch_messages, list_messages
 from app.services.token_manager import get_valid_access_token
-from app.services.agents.email_agent import categorize_emails, generate_daily_report
+from app.services.agents.email_agent import acategorize_emails, agenerate_daily_report
 
 router = APIRouter()
 
@@ -33,6 +33,23 @@ def _format_gmail_message(msg) -> dict:
     }
 
 
+async def _load_todos(db: AsyncSession, user: User) -> list[dict]:
+    todo_result = await db.execute(
+        select(Todo)
+        .where(Todo.user_id == user.id)
+        .order_by(Todo.priority, Todo.created_at.desc())
+    )
+    return [
+        {
+            "text": todo.text,
+            "completed": todo.completed,
+            "source": todo.source,
+            "priority": todo.priority,
+        }
+        for todo in todo_result.scalars().all()
+    ]
+
+
 @router.get("/daily")
 async def get_daily_report(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -46,27 +63,19 @@ async def get_daily_report(
     )
     msg_ids = [m["id"] for m in message_refs if isinstance(m, dict) and "id" in m]
 
+    email_dicts: list[dict] = []
     if msg_ids:
         messages = await fetch_messages(access_token, msg_ids, include_body=True)
         email_dicts = [_format_gmail_message(m) for m in messages]
-        categorized = await asyncio.to_thread(categorize_emails, email_dicts)
-    else:
-        categorized = []
-
-    todo_result = await db.execute(
-        select(Todo)
-        .where(Todo.user_id == user.id)
-        .order_by(Todo.priority, Todo.created_at.desc())
-    )
-    todos = [
-        {
-            "text": todo.text,
-            "completed": todo.completed,
-            "source": todo.source,
-            "priority": todo.priority,
-        }
-        for todo in todo_result.scalars().all()
-    ]
 
-    report = await asyncio.to_thread(generate_daily_report, categorized, todos)
+    # Categorization is the slow LLM call; load todos from the database while it runs.
+    categorize_task = asyncio.create_task(acategorize_emails(email_dicts))
+    try:
+        todos = await _load_todos(db, user)
+        categorized = await categorize_task
+    finally:
+        # No-op once categorization has finished; stops it if the query fails or the
+        # request is cancelled.
+        categorize_task.cancel()
+    report = await agenerate_daily_report(categorized, todos)
     return report
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
@@ -13,7 +12,7 @@ from app.db import get_db
 from app.db.models import User
 from app.services.gmail import fetch_messages, list_messages
 from app.services.token_manager import get_valid_access_token
-from app.services.agents.email_agent import detect_subscriptions
+from app.services.agents.email_agent import adetect_subscriptions
 
 router = APIRouter()
 
@@ -60,5 +59,5 @@ async def get_subscriptions(
     messages = await fetch_messages(access_token, message_ids, include_body=True)
     email_dicts = [_format_gmail_message(m) for m in messages]
 
-    subscriptions = await asyncio.to_thread(detect_subscriptions, email_dicts)
+    subscriptions = await adetect_subscriptions(email_dicts)
     return {"subscriptions": subscriptions}
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Annotated, Optional
 from uuid import UUID
 
@@ -16,7 +15,7 @@ from app.db import get_db
 from app.db.models import Todo, User
 from app.services.gmail import fetch_messages, list_messages
 from app.services.token_manager import get_valid_access_token
-from app.services.agents.email_agent import extract_todos
+from app.services.agents.email_agent import aextract_todos
 
 router = APIRouter()
 
@@ -90,7 +89,7 @@ async def generate_todos(
 
     messages = await fetch_messages(access_token, msg_ids, include_body=True)
     email_dicts = [_format_gmail_message(m) for m in messages if not m.is_automated_sender]
-    todos_result = await asyncio.to_thread(extract_todos, email_dicts, existing_todo_texts)
+    todos_result = await aextract_todos(email_dicts, existing_todo_texts)
 
     raw_todos = todos_result.get("todos", [])
 
@@ -88,6 +88,12 @@ class Settings:
     max_thread_summaries: int = field(default=10)
     max_meeting_summaries: int = field(default=10)
     llm_parallelism: int = field(default=3)
+    llm_max_concurrency: int = field(default=16)
+
+    # LLM response cache (readwrite | readonly | off)
+    llm_cache_mode: str = field(default="off")
+    llm_cache_ttl_seconds: int = field(default=1800)
+    llm_cache_path: str = field(default="")
 
 
 _CACHED_SETTINGS: Settings | None = None
@@ -200,6 +206,12 @@ def load_settings() -> Settings:
         max_thread_summaries=_get_int("MAX_THREAD_SUMMARIES", 10),
         max_meeting_summaries=_get_int("MAX_MEETING_SUMMARIES", 10),
         llm_parallelism=_get_int("LLM_PARALLELISM", 3),
+        llm_max_concurrency=_get_int("LLM_MAX_CONCURRENCY", 16),
+
+        # LLM response cache
+        llm_cache_mode=os.getenv("LLM_CACHE_MODE", "off").lower(),
+        llm_cache_ttl_seconds=_get_int("LLM_CACHE_TTL_SECONDS", 1800),
+        llm_cache_path=os.getenv("LLM_CACHE_PATH", ""),
     )
 
     _CACHED_SETTINGS = settings
@@ -36,6 +36,7 @@ settings = load_settings()
 
 from app.api.router import api_router
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.services.agents.base import close_http_clients
 from app.services.todo_sync import run_todo_sync_loop
 
 
@@ -45,6 +46,7 @@ async def lifespan(app: FastAPI):
     sync_task = asyncio.create_task(run_todo_sync_loop())
     yield
     sync_task.cancel()
+    await close_http_clients()
 
     from app.db.engine import engine
     await engine.dispose()
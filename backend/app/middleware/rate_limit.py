@@ -37,7 +37,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 self._redis = Redis.from_url(settings.redis_url)
                 self._redis.ping()
             except Exception as e:
-                logger.warning(f"Redis not available for rate limiting: {e}")
+                logger.warning("Redis not available for rate limiting: %s", e)
                 self._redis = None
         return self._redis
 
@@ -1,11 +1,15 @@
 """SaturdAI agent modules: email intelligence, command routing, and LLM base."""
 
-from app.services.agents.email_agent import categorize_emails, create_tldr_digest, detect_subscriptions
-from app.services.agents.router_agent import route_command
+from app.services.agents.email_agent import (
+    acategorize_emails,
+    acreate_tldr_digest,
+    adetect_subscriptions,
+)
+from app.services.agents.router_agent import aroute_command
 
 __all__ = [
-    "categorize_emails",
-    "create_tldr_digest",
-    "detect_subscriptions",
-    "route_command",
+    "acategorize_emails",
+    "acreate_tldr_digest",
+    "adetect_subscriptions",
+    "aroute_command",
 ]
@@ -2,20 +2,55 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
+import random
+import sqlite3
+import threading
 import time
-from collections.abc import Awaitable, Callable
+from bisect import bisect_right
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, cast
 
 import httpx
+import orjson
 from openrouter import OpenRouter
+from openrouter.errors import NoResponseError, OpenRouterError
+from pydantic import BaseModel
+from redis.asyncio import Redis
 
 from app.core.env import load_settings
 
 settings = load_settings()
 logger = logging.getLogger(__name__)
 
+
+class LLMError(Exception):
+    """An LLM call failed: transport, provider, configuration or unusable-response error.
+
+    The public call helpers raise only this for LLM failures, so agents can fall back on
+    it while any other exception (a bug in the caller) still propagates.
+    """
+
+
+# What the provider code paths below raise on failure; wrapped into LLMError at the
+# public entry points and never caught outside this module.
+_PROVIDER_ERRORS: tuple[type[Exception], ...] = (
+    httpx.HTTPError,
+    TimeoutError,
+    RuntimeError,
+    ValueError,
+    OpenRouterError,
+    NoResponseError,
+)
+
+# Settings are frozen after load, so resolve the provider once instead of per call.
+_PROVIDER = (settings.llm_provider or "openai").lower()
+
 # Evidence budget limits from spec
 MAX_EVIDENCE_IDS_PER_STORY = 120
 MAX_THREADS_FOR_DOSSIER = 50
@@ -29,8 +64,84 @@ _OPENAI_TERMINAL_STATUSES = {"completed", "failed", "cancelled", "incomplete"}
 # incomplete, the targeted retry path below will kick in.
 _GPT5_JSON_MIN_OUTPUT_TOKENS = 2500
 _GPT5_JSON_RETRY_OUTPUT_TOKENS = 8000
+# Polling /responses/{id} uses full-jitter exponential backoff so concurrent callers
+# don't poll in lockstep. Rate-limit/server errors widen the backoff cap until a
+# successful poll resets it.
+_POLL_BASE_DELAY_SECONDS = 0.25
+_POLL_MAX_DELAY_SECONDS = 2.0
+_POLL_MAX_ERROR_DELAY_SECONDS = 60.0
+_POLL_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Once enough completion times have been observed for a model, polls are placed to
+# minimize expected detection delay for a fixed poll budget (optimal placement
+# recurrence L_{i+1} = L_i + (F(L_i) - F(L_{i-1})) / p(L_i) over the empirical
+# distribution), with the last poll at the p99 completion time.
+_ADAPTIVE_POLL_MIN_SAMPLES = 20
+_ADAPTIVE_POLL_WINDOW = 200
+_ADAPTIVE_POLL_BUDGET = 8
+_completion_time_samples: dict[str, deque[float]] = {}
+# LLM calls share one pooled HTTP/2 client so requests multiplex over a few warm
+# connections instead of paying a TLS handshake per call.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=30,
+)
+_async_http_client: httpx.AsyncClient | None = None
+# One OpenRouter SDK instance per process: each instance also creates its own sync httpx
+# client, which would otherwise leak until garbage collection on every call.
+_openrouter_client: OpenRouter | None = None
+# Caps in-flight async LLM requests (OpenAI and OpenRouter) per process so bursts of
+# agent calls queue locally instead of tripping 429s and paying a full retry round trip.
+_llm_semaphore = asyncio.Semaphore(max(1, settings.llm_max_concurrency))
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use."""
+    global _async_http_client
+    if _async_http_client is None or _async_http_client.is_closed:
+        _async_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=_HTTP_LIMITS,
+            timeout=60,
+        )
+    return _async_http_client
+
 
+def _get_openrouter_client() -> OpenRouter:
+    """Return the shared OpenRouter SDK client, bound to the shared async HTTP client."""
+    global _openrouter_client
+    if _openrouter_client is None:
+        _openrouter_client = OpenRouter(
+            api_key=settings.openrouter_api_key,
+            async_client=get_async_http_client(),
+        )
+    return _openrouter_client
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients, if they were created."""
+    global _async_http_client, _openrouter_client
+    if _openrouter_client is not None:
+        # Leaving the SDK context closes the sync client it created for itself; the async
+        # client was supplied by us and is closed below.
+        _openrouter_client.__exit__(None, None, None)
+        _openrouter_client = None
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+
+
+@lru_cache(maxsize=64)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Stable key for OpenAI prompt caching.
 
+    OpenAI caches long shared prompt prefixes automatically; tagging requests that share a
+    system prompt with the same key routes them to the same cache and raises the hit rate.
+    """
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:32]
+
+
+@lru_cache(maxsize=32)
 def _is_gpt5_family_model(model: str) -> bool:
     normalized_model = model.strip().lower()
     return normalized_model.startswith("gpt-5")
@@ -56,21 +167,20 @@ def _extract_openai_text(payload: dict[str, Any]) -> str:
             f"(status={status}, error={error}, incomplete_details={incomplete_details}, payload_keys={sorted(payload.keys())})"
         )
 
+    # Common case: one message item holding a single output_text part.
+    if len(output) == 1 and isinstance(output[0], dict):
+        content = output[0].get("content")
+        if isinstance(content, list) and len(content) == 1 and isinstance(content[0], dict):
+            part = content[0]
+            text_value = part.get("text")
+            if part.get("type") == "output_text" and isinstance(text_value, str) and text_value.strip():
+                return text_value
+
     chunks: list[str] = []
     json_chunks: list[str] = []
-    part_types: list[str] = []
-    output_item_summaries: list[dict[str, Any]] = []
     for item in output:
         if not isinstance(item, dict):
             continue
-        if len(output_item_summaries) < 3:
-            output_item_summaries.append(
-                {
-                    "item_type": item.get("type"),
-                    "item_keys": sorted(item.keys()),
-                    "content_type": type(item.get("content")).__name__,
-                }
-            )
         content = item.get("content")
         if isinstance(content, str) and content.strip():
             chunks.append(content)
@@ -85,9 +195,6 @@ def _extract_openai_text(payload: dict[str, Any]) -> str:
         for part in content_parts:
             if not isinstance(part, dict):
                 continue
-            part_type = part.get("type")
-            if isinstance(part_type, str):
-                part_types.append(part_type)
             if part.get("type") == "output_text" and isinstance(part.get("text"), str):
                 chunks.append(cast(str, part.get("text")))
             if part.get("type") == "output_text" and isinstance(part.get("text"), dict):
@@ -97,54 +204,186 @@ def _extract_openai_text(payload: dict[str, Any]) -> str:
             if part.get("type") == "refusal" and isinstance(part.get("refusal"), str):
                 chunks.append(cast(str, part.get("refusal")))
             if part.get("type") == "output_json" and isinstance(part.get("json"), (dict, list)):
-                json_chunks.append(json.dumps(part.get("json")))
+                json_chunks.append(orjson.dumps(part.get("json")).decode())
 
         if item.get("type") == "refusal" and isinstance(item.get("refusal"), str):
             chunks.append(cast(str, item.get("refusal")))
         if item.get("type") == "output_text" and isinstance(item.get("text"), str):
             chunks.append(cast(str, item.get("text")))
         if item.get("type") == "output_json" and isinstance(item.get("json"), (dict, list)):
-            json_chunks.append(json.dumps(item.get("json")))
+            json_chunks.append(orjson.dumps(item.get("json")).decode())
 
     text = "".join(chunks)
     if not text.strip():
         if json_chunks:
             return "".join(json_chunks)
         incomplete_details = payload.get("incomplete_details")
+        part_types, output_item_summaries = _summarize_openai_output(output)
         raise ValueError(
             "OpenAI response did not contain text "
-            f"(status={status}, incomplete_details={incomplete_details}, payload_keys={sorted(payload.keys())}, part_types={sorted(set(part_types))}, output_items={output_item_summaries})"
+            f"(status={status}, incomplete_details={incomplete_details}, payload_keys={sorted(payload.keys())}, part_types={sorted(part_types)}, output_items={output_item_summaries})"
         )
     return text
 
 
-def _poll_openai_response_until_terminal(
+def _summarize_openai_output(output: list[Any]) -> tuple[set[str], list[dict[str, Any]]]:
+    """Collect content part types and a few item shapes for error messages.
+
+    Only called on the failure path so successful extractions don't pay for it.
+    """
+    part_types: set[str] = set()
+    output_item_summaries: list[dict[str, Any]] = []
+    for item in output:
+        if not isinstance(item, dict):
+            continue
+        content = item.get("content")
+        if len(output_item_summaries) < 3:
+            output_item_summaries.append(
+                {
+                    "item_type": item.get("type"),
+                    "item_keys": sorted(item.keys()),
+                    "content_type": type(content).__name__,
+                }
+            )
+        content_parts = content if isinstance(content, list) else [content]
+        for part in content_parts:
+            if isinstance(part, dict) and isinstance(part.get("type"), str):
+                part_types.add(part["type"])
+    return part_types, output_item_summaries
+
+
+def _record_completion_time(model: str, elapsed_seconds: float) -> None:
+    samples = _completion_time_samples.get(model)
+    if samples is None:
+        samples = deque(maxlen=_ADAPTIVE_POLL_WINDOW)
+        _completion_time_samples[model] = samples
+    samples.append(elapsed_seconds)
+
+
+def _empirical_cdf(sorted_samples: list[float], t: float) -> float:
+    return bisect_right(sorted_samples, t) / len(sorted_samples)
+
+
+def _empirical_density(sorted_samples: list[float], t: float, bandwidth: float) -> float:
+    mass = _empirical_cdf(sorted_samples, t + bandwidth) - _empirical_cdf(sorted_samples, t - bandwidth)
+    return mass / (2 * bandwidth)
+
+
+def _poll_schedule_from_first(
+    sorted_samples: list[float],
+    first_poll: float,
+    upper: float,
+    bandwidth: float,
+) -> list[float]:
+    poll_times = [0.0, first_poll]
+    while len(poll_times) <= _ADAPTIVE_POLL_BUDGET and poll_times[-1] < upper:
+        previous, current = poll_times[-2], poll_times[-1]
+        density = _empirical_density(sorted_samples, current, bandwidth)
+        if density <= 0:
+            poll_times.append(upper)
+            break
+        mass = _empirical_cdf(sorted_samples, current) - _empirical_cdf(sorted_samples, previous)
+        poll_times.append(current + mass / density)
+    return poll_times[1:]
+
+
+def _adaptive_poll_schedule(model: str) -> list[float] | None:
+    """Poll offsets (seconds since polling started) for a model, or None until enough samples exist."""
+    samples = _completion_time_samples.get(model)
+    if samples is None or len(samples) < _ADAPTIVE_POLL_MIN_SAMPLES:
+        return None
+
+    sorted_samples = sorted(samples)
+    upper = sorted_samples[min(len(sorted_samples) - 1, int(0.99 * len(sorted_samples)))]
+    if upper <= 0:
+        return None
+    bandwidth = max(upper / 20, 0.05)
+
+    # A later first poll stretches every following interval, so bisect on the first
+    # poll until the budget lands the final poll on the p99 completion time.
+    low, high = 0.0, upper
+    for _ in range(30):
+        first_poll = (low + high) / 2
+        schedule = _poll_schedule_from_first(sorted_samples, first_poll, upper, bandwidth)
+        if schedule[-1] < upper:
+            low = first_poll
+        else:
+            high = first_poll
+
+    schedule = _poll_schedule_from_first(sorted_samples, high, upper, bandwidth)
+    return [min(poll_time, upper) for poll_time in schedule]
+
+
+def _next_poll_delay_cap(poll_response: httpx.Response, delay_cap: float) -> float:
+    """Widen the backoff cap on 429/5xx, reset it on success, raise on other errors."""
+    if poll_response.status_code in _POLL_RETRYABLE_STATUS_CODES:
+        return min(delay_cap * 2, _POLL_MAX_ERROR_DELAY_SECONDS)
+    poll_response.raise_for_status()
+    return _POLL_MAX_DELAY_SECONDS
+
+
+def _poll_delay_seconds(
+    poll_response: httpx.Response,
+    attempt: int,
+    delay_cap: float,
+    elapsed_seconds: float,
+    timeout_seconds: float,
+    schedule: list[float] | None,
+) -> float:
+    """Delay before the next poll, never sleeping past the deadline.
+
+    Retry-After wins when present; otherwise follow the adaptive schedule for successful
+    polls, falling back to full-jitter backoff for errors or once the schedule is spent.
+    """
+    retry_after = poll_response.headers.get("Retry-After")
+    try:
+        delay = min(float(retry_after), _POLL_MAX_ERROR_DELAY_SECONDS) if retry_after else None
+    except ValueError:
+        delay = None
+    if delay is None and schedule and poll_response.status_code not in _POLL_RETRYABLE_STATUS_CODES:
+        next_poll_at = next((poll_time for poll_time in schedule if poll_time > elapsed_seconds), None)
+        if next_poll_at is not None:
+            delay = next_poll_at - elapsed_seconds
+    if delay is None:
+        delay = random.uniform(0, min(delay_cap, _POLL_BASE_DELAY_SECONDS * (2 ** attempt)))
+    return max(0.0, min(delay, timeout_seconds - elapsed_seconds))
+
+
+async def _apoll_openai_response_until_terminal(
     *,
-    client: httpx.Client,
+    client: httpx.AsyncClient,
     response_id: str,
     headers: dict[str, str],
+    model: str,
     timeout_seconds: float = 30.0,
 ) -> dict[str, Any]:
     started_at = time.monotonic()
-    delay_seconds = 0.25
+    schedule = _adaptive_poll_schedule(model)
+    attempt = 0
+    delay_cap = _POLL_MAX_DELAY_SECONDS
 
     while True:
-        if time.monotonic() - started_at > timeout_seconds:
-            raise TimeoutError(f"OpenAI response not ready after {timeout_seconds:.0f}s (id={response_id})")
-
-        poll_response = client.get(
+        poll_response = await client.get(
             f"https://api.openai.com/v1/responses/{response_id}",
             headers=headers,
         )
-        poll_response.raise_for_status()
-        payload = poll_response.json()
+        elapsed = time.monotonic() - started_at
+        delay_cap = _next_poll_delay_cap(poll_response, delay_cap)
+        if poll_response.status_code not in _POLL_RETRYABLE_STATUS_CODES:
+            payload = orjson.loads(poll_response.content)
+            status = payload.get("status")
+            if isinstance(status, str) and status in _OPENAI_TERMINAL_STATUSES:
+                _record_completion_time(model, elapsed)
+                return payload
+
+        if elapsed > timeout_seconds:
+            raise TimeoutError(f"OpenAI response not ready after {timeout_seconds:.0f}s (id={response_id})")
 
-        status = payload.get("status")
-        if isinstance(status, str) and status in _OPENAI_TERMINAL_STATUSES:
-            return payload
+        await asyncio.sleep(
+            _poll_delay_seconds(poll_response, attempt, delay_cap, elapsed, timeout_seconds, schedule)
+        )
+        attempt += 1
 
-        time.sleep(delay_seconds)
-        delay_seconds = min(delay_seconds * 2, 2.0)
 
 def _format_openai_http_error(response: httpx.Response) -> str:
     """Best-effort extraction of OpenAI error details."""
@@ -169,13 +408,21 @@ def _format_openai_http_error(response: httpx.Response) -> str:
     return str(body)[:2000]
 
 
-def _call_openai_chat_completions(
+def _openai_headers() -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {settings.openai_api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _build_chat_completions_body(
     system_prompt: str,
     user_prompt: str,
     max_tokens: int,
     model: str,
     json_mode: bool,
-) -> str:
+    json_schema: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     request_body: dict[str, Any] = {
         "model": model,
         "messages": [
@@ -184,25 +431,15 @@ def _call_openai_chat_completions(
         ],
         "max_tokens": max_tokens,
         "temperature": 0,
+        "prompt_cache_key": _prompt_cache_key(system_prompt),
     }
 
     if json_mode:
-        request_body["response_format"] = {"type": "json_object"}
-
-    headers = {
-        "Authorization": f"Bearer {settings.openai_api_key}",
-        "Content-Type": "application/json",
-    }
+        request_body["response_format"] = _chat_response_format(json_schema)
+    return request_body
 
-    with httpx.Client(timeout=60) as client:
-        response = client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=request_body,
-        )
-        response.raise_for_status()
-        payload = response.json()
 
+def _extract_chat_completions_text(payload: dict[str, Any]) -> str:
     try:
         choice = payload["choices"][0]
         message = choice["message"]
@@ -214,32 +451,84 @@ def _call_openai_chat_completions(
         raise ValueError(f"Unexpected chat.completions payload: {payload}") from e
 
 
-def _call_openai(
+async def _acall_openai_chat_completions(
     system_prompt: str,
     user_prompt: str,
     max_tokens: int,
     model: str,
     json_mode: bool,
+    json_schema: dict[str, Any] | None = None,
 ) -> str:
-    if not settings.openai_api_key:
-        raise ValueError("OPENAI_API_KEY not configured")
+    request_body = _build_chat_completions_body(
+        system_prompt, user_prompt, max_tokens, model, json_mode, json_schema
+    )
 
+    client = get_async_http_client()
+    async with _llm_semaphore:
+        response = await client.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers=_openai_headers(),
+            content=orjson.dumps(request_body),
+        )
+    response.raise_for_status()
+    payload = orjson.loads(response.content)
+
+    return _extract_chat_completions_text(payload)
+
+
+@lru_cache(maxsize=32)
+def _gpt5_json_body_template(model: str) -> dict[str, Any]:
+    """Static part of a GPT-5 JSON-mode Responses request; callers must not mutate it."""
+    return {
+        "model": model,
+        # Encourage the model to emit JSON quickly rather than spending budget on reasoning.
+        "reasoning": {"effort": "low"},
+        "text": {"format": {"type": "json_object"}},
+    }
+
+
+def _chat_response_format(json_schema: dict[str, Any] | None) -> dict[str, Any]:
+    if json_schema:
+        return {"type": "json_schema", "json_schema": {**json_schema, "strict": True}}
+    return {"type": "json_object"}
+
+
+def _responses_text_format(json_schema: dict[str, Any] | None) -> dict[str, Any]:
+    if json_schema:
+        return {"format": {"type": "json_schema", **json_schema, "strict": True}}
+    return {"format": {"type": "json_object"}}
+
+
+def _build_openai_responses_body(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    model: str,
+    json_mode: bool,
+    json_schema: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    request_body: dict[str, Any]
     if _is_gpt5_family_model(model):
-        gpt5_max_output_tokens = max_tokens
-        gpt5_reasoning_effort = settings.llm_reasoning_effort
         if json_mode:
-            gpt5_max_output_tokens = max(
-                gpt5_max_output_tokens, _GPT5_JSON_MIN_OUTPUT_TOKENS
-            )
-            # Encourage the model to emit JSON quickly rather than spending budget on reasoning.
-            gpt5_reasoning_effort = "low"
+            # Hot path for the JSON agents: only the prompts and token budget vary.
+            request_body = {
+                **_gpt5_json_body_template(model),
+                "instructions": system_prompt,
+                "input": user_prompt,
+                "max_output_tokens": max(max_tokens, _GPT5_JSON_MIN_OUTPUT_TOKENS),
+                "prompt_cache_key": _prompt_cache_key(system_prompt),
+            }
+            if json_schema:
+                request_body["text"] = _responses_text_format(json_schema)
+            return request_body
 
-        request_body: dict[str, Any] = {
+        request_body = {
             "model": model,
             "instructions": system_prompt,
             "input": user_prompt,
-            "max_output_tokens": gpt5_max_output_tokens,
-            "reasoning": {"effort": gpt5_reasoning_effort},
+            "max_output_tokens": max_tokens,
+            "reasoning": {"effort": settings.llm_reasoning_effort},
+            "prompt_cache_key": _prompt_cache_key(system_prompt),
         }
     else:
         request_body = {
@@ -256,100 +545,148 @@ def _call_openai(
             ],
             "max_output_tokens": max_tokens,
             "temperature": 0,
+            "prompt_cache_key": _prompt_cache_key(system_prompt),
         }
 
     if json_mode:
-        request_body["text"] = {"format": {"type": "json_object"}}
+        request_body["text"] = _responses_text_format(json_schema)
+    return request_body
+
+
+def _log_openai_responses_failure(
+    response: httpx.Response,
+    model: str,
+    json_mode: bool,
+    request_body: dict[str, Any],
+) -> str:
+    details = _format_openai_http_error(response)
+    logger.warning(
+        "OpenAI /v1/responses failed (%s) model=%s json_mode=%s request_keys=%s: %s",
+        response.status_code,
+        model,
+        json_mode,
+        sorted(request_body.keys()),
+        details,
+    )
+    return details
+
+
+def _should_fall_back_to_chat_completions(response: httpx.Response, model: str) -> bool:
+    # Some environments/accounts reject the Responses schema/model.
+    # Fall back to Chat Completions for local dev robustness.
+    # GPT-5 family models are designed for the Responses API; falling back to
+    # chat.completions produces confusing benchmark results and often 400s.
+    return response.status_code == 400 and not _is_gpt5_family_model(model)
+
+
+def _needs_polling(payload: dict[str, Any]) -> str | None:
+    """Return the response id to poll when the payload is not terminal yet."""
+    status = payload.get("status")
+    if isinstance(status, str) and status and status not in _OPENAI_TERMINAL_STATUSES:
+        response_id = payload.get("id")
+        if isinstance(response_id, str) and response_id:
+            return response_id
+    return None
 
-    headers = {
-        "Authorization": f"Bearer {settings.openai_api_key}",
-        "Content-Type": "application/json",
-    }
 
-    with httpx.Client(timeout=60) as client:
-        response = client.post(
+def _gpt5_json_retry_body(
+    payload: dict[str, Any],
+    request_body: dict[str, Any],
+    model: str,
+    json_mode: bool,
+) -> dict[str, Any] | None:
+    """Build the retry request for GPT-5 JSON calls that ran out of output tokens.
+
+    Sometimes the response is terminal but contains no output_text
+    (e.g. status=incomplete reason=max_output_tokens).
+    """
+    if not (
+        json_mode
+        and _is_gpt5_family_model(model)
+        and isinstance(payload.get("status"), str)
+        and payload.get("status") == "incomplete"
+        and isinstance(payload.get("incomplete_details"), dict)
+        and payload.get("incomplete_details", {}).get("reason") == "max_output_tokens"
+    ):
+        return None
+
+    retry_body = dict(request_body)
+    retry_body["max_output_tokens"] = max(
+        int(retry_body.get("max_output_tokens") or 0),
+        _GPT5_JSON_RETRY_OUTPUT_TOKENS,
+    )
+    retry_body["reasoning"] = {"effort": "low"}
+    return retry_body
+
+
+async def _acall_openai(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    model: str,
+    json_mode: bool,
+    json_schema: dict[str, Any] | None = None,
+) -> str:
+    if not settings.openai_api_key:
+        raise ValueError("OPENAI_API_KEY not configured")
+
+    request_body = _build_openai_responses_body(
+        system_prompt, user_prompt, max_tokens, model, json_mode, json_schema
+    )
+    headers = _openai_headers()
+
+    client = get_async_http_client()
+    async with _llm_semaphore:
+        response = await client.post(
             "https://api.openai.com/v1/responses",
             headers=headers,
-            json=request_body,
+            content=orjson.dumps(request_body),
         )
 
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            details = _format_openai_http_error(response)
-            logger.warning(
-                "OpenAI /v1/responses failed (%s) model=%s json_mode=%s request_keys=%s: %s",
-                response.status_code,
-                model,
-                json_mode,
-                sorted(request_body.keys()),
-                details,
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        details = _log_openai_responses_failure(response, model, json_mode, request_body)
+        if _should_fall_back_to_chat_completions(response, model):
+            return await _acall_openai_chat_completions(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                max_tokens=max_tokens,
+                model=model,
+                json_mode=json_mode,
+                json_schema=json_schema,
             )
 
-            # Some environments/accounts reject the Responses schema/model.
-            # Fall back to Chat Completions for local dev robustness.
-            if response.status_code == 400:
-                # GPT-5 family models are designed for the Responses API; falling back to
-                # chat.completions produces confusing benchmark results and often 400s.
-                if _is_gpt5_family_model(model):
-                    raise RuntimeError(
-                        f"OpenAI API error {response.status_code} calling /v1/responses: {details}"
-                    ) from e
-
-                return _call_openai_chat_completions(
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    max_tokens=max_tokens,
-                    model=model,
-                    json_mode=json_mode,
-                )
-
-            raise RuntimeError(
-                f"OpenAI API error {response.status_code} calling /v1/responses: {details}"
-            ) from e
-
-        payload = response.json()
-        status = payload.get("status")
-        if isinstance(status, str) and status and status not in _OPENAI_TERMINAL_STATUSES:
-            response_id = payload.get("id")
-            if isinstance(response_id, str) and response_id:
-                payload = _poll_openai_response_until_terminal(
-                    client=client,
-                    response_id=response_id,
-                    headers=headers,
-                )
-
-        try:
-            return _extract_openai_text(payload)
-        except ValueError as e:
-            # Targeted retry for GPT-5 JSON: sometimes the response is terminal but contains
-            # no output_text (e.g. status=incomplete reason=max_output_tokens).
-            if (
-                json_mode
-                and _is_gpt5_family_model(model)
-                and isinstance(payload.get("status"), str)
-                and payload.get("status") == "incomplete"
-                and isinstance(payload.get("incomplete_details"), dict)
-                and payload.get("incomplete_details", {}).get("reason") == "max_output_tokens"
-            ):
-                retry_body = dict(request_body)
-                retry_body["max_output_tokens"] = max(
-                    int(retry_body.get("max_output_tokens") or 0),
-                    _GPT5_JSON_RETRY_OUTPUT_TOKENS,
-                )
-                retry_body["reasoning"] = {"effort": "low"}
+        raise RuntimeError(
+            f"OpenAI API error {response.status_code} calling /v1/responses: {details}"
+        ) from e
 
-                retry_response = client.post(
-                    "https://api.openai.com/v1/responses",
-                    headers=headers,
-                    json=retry_body,
-                )
-                retry_response.raise_for_status()
-                retry_payload = retry_response.json()
-                return _extract_openai_text(retry_payload)
+    payload = orjson.loads(response.content)
+    response_id = _needs_polling(payload)
+    if response_id:
+        payload = await _apoll_openai_response_until_terminal(
+            client=client,
+            response_id=response_id,
+            headers=headers,
+            model=model,
+        )
 
+    try:
+        return _extract_openai_text(payload)
+    except ValueError:
+        retry_body = _gpt5_json_retry_body(payload, request_body, model, json_mode)
+        if retry_body is None:
             raise
 
+        async with _llm_semaphore:
+            retry_response = await client.post(
+                "https://api.openai.com/v1/responses",
+                headers=headers,
+                content=orjson.dumps(retry_body),
+            )
+        retry_response.raise_for_status()
+        return _extract_openai_text(orjson.loads(retry_response.content))
+
 
 def _openrouter_provider_prefs() -> dict[str, Any]:
     """Return OpenRouter provider routing preferences optimized for speed."""
@@ -359,14 +696,14 @@ def _openrouter_provider_prefs() -> dict[str, Any]:
     }
 
 
-def _call_openrouter(
+def _build_openrouter_kwargs(
     system_prompt: str,
     user_prompt: str,
     max_tokens: int,
     model: str,
     json_mode: bool,
-) -> str:
-    """Call OpenRouter API using the official SDK."""
+    json_schema: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     if not settings.openrouter_api_key:
         raise ValueError("OPENROUTER_API_KEY not configured")
 
@@ -382,33 +719,315 @@ def _call_openrouter(
     }
 
     if json_mode:
-        kwargs["response_format"] = {"type": "json_object"}
+        kwargs["response_format"] = _chat_response_format(json_schema)
+    return kwargs
 
-    with OpenRouter(api_key=settings.openrouter_api_key) as client:
-        response = client.chat.send(**kwargs)
 
-    content = response.choices[0].message.content
+def _extract_openrouter_text(response: Any) -> str:
+    choices = getattr(response, "choices", None)
+    if not choices or getattr(choices[0], "message", None) is None:
+        raise ValueError("OpenRouter response had no choices")
+    content = choices[0].message.content
     if not isinstance(content, str):
         raise ValueError("Unexpected OpenRouter response content")
     return content
 
 
-def _call_llm_text(
+async def _acall_openrouter(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    model: str,
+    json_mode: bool,
+    json_schema: dict[str, Any] | None = None,
+) -> str:
+    """Call OpenRouter API using the official SDK's async interface."""
+    kwargs = _build_openrouter_kwargs(
+        system_prompt, user_prompt, max_tokens, model, json_mode, json_schema
+    )
+
+    async with _llm_semaphore:
+        response = await _get_openrouter_client().chat.send_async(**kwargs)
+
+    return _extract_openrouter_text(response)
+
+
+class _LLMCache:
+    """TTL cache for LLM text responses, shared across processes via Redis when available.
+
+    Only JSON calls sent with temperature=0 are cached (see ``_is_cacheable``), so
+    identical prompts are safe to memoize.
+    Mode is one of "readwrite", "readonly" (serve hits, never record) or "off".
+    When Redis is unreachable and a SQLite path is configured, entries are persisted
+    there instead so they survive restarts and are shared by workers on the same host.
+    """
+
+    _REDIS_PREFIX = "llm_cache:"
+    _REDIS_RETRY_SECONDS = 60.0
+    _MAX_LOCAL_ENTRIES = 1024
+
+    def __init__(self, mode: str, ttl_seconds: int, redis_url: str, sqlite_path: str = "") -> None:
+        self._mode = mode
+        self._ttl_seconds = ttl_seconds
+        self._redis_url = redis_url
+        self._redis: Redis | None = None
+        self._redis_retry_at = 0.0
+        self._redis_lock = asyncio.Lock()
+        self._sqlite_path = sqlite_path
+        self._sqlite: sqlite3.Connection | None = None
+        self._sqlite_checked = False
+        self._sqlite_lock = threading.Lock()
+        self._store: dict[str, tuple[str, float]] = {}
+
+    @staticmethod
+    def make_key(
+        *,
+        provider: str,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        json_mode: bool,
+        json_schema: dict[str, Any] | None = None,
+    ) -> str:
+        material = orjson.dumps(
+            {
+                "p": provider,
+                "m": model,
+                "s": system_prompt,
+                "u": user_prompt,
+                "t": max_tokens,
+                "j": json_mode,
+                "js": json_schema,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(material).hexdigest()
+
+    async def redis(self) -> Redis | None:
+        """Lazy load Redis connection; fall back to the in-process store if unavailable.
+
+        A failed connection is retried after _REDIS_RETRY_SECONDS, so a Redis blip at
+        startup does not disable the shared cache for the life of the process.
+        """
+        if self._redis is not None or time.monotonic() < self._redis_retry_at:
+            return self._redis
+        async with self._redis_lock:
+            if self._redis is None and time.monotonic() >= self._redis_retry_at:
+                client = Redis.from_url(self._redis_url)
+                try:
+                    await client.ping()
+                except Exception as e:
+                    logger.warning("Redis not available for LLM cache: %s", e)
+                    await client.aclose()
+                    self._redis_retry_at = time.monotonic() + self._REDIS_RETRY_SECONDS
+                else:
+                    self._redis = client
+        return self._redis
+
+    def _sqlite_connection(self) -> sqlite3.Connection | None:
+        """Lazy open the SQLite cache file, if one is configured. Call with _sqlite_lock held."""
+        if not self._sqlite_checked:
+            self._sqlite_checked = True
+            if not self._sqlite_path:
+                return None
+            try:
+                Path(self._sqlite_path).parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(self._sqlite_path, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS llm_cache_expires_at ON llm_cache (expires_at)"
+                )
+                connection.commit()
+                self._sqlite = connection
+            except sqlite3.Error as e:
+                logger.warning("SQLite not available for LLM cache: %s", e)
+                self._sqlite = None
+        return self._sqlite
+
+    async def get(self, key: str) -> str | None:
+        if self._mode == "off":
+            return None
+
+        entry = self._store.get(key)
+        if entry is not None:
+            text, expires_at = entry
+            if expires_at > time.monotonic():
+                return text
+            self._store.pop(key, None)
+
+        redis = await self.redis()
+        if redis is not None:
+            text = await self._redis_get(redis, key)
+        elif self._sqlite_path:
+            # SQLite is blocking I/O, so it runs on a worker thread off the event loop.
+            text = await asyncio.to_thread(self._sqlite_get, key)
+        else:
+            text = None
+        if text is None:
+            return None
+
+        self._remember(key, text)
+        return text
+
+    async def set(self, key: str, text: str) -> None:
+        if self._mode != "readwrite":
+            return
+
+        self._remember(key, text)
+        redis = await self.redis()
+        if redis is not None:
+            await self._redis_set(redis, key, text)
+        elif self._sqlite_path:
+            await asyncio.to_thread(self._sqlite_set, key, text)
+
+    async def _redis_get(self, redis: Redis, key: str) -> str | None:
+        try:
+            cached = await redis.get(self._REDIS_PREFIX + key)
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+        if cached is None:
+            return None
+        return cached.decode("utf-8")
+
+    async def _redis_set(self, redis: Redis, key: str, text: str) -> None:
+        try:
+            await redis.setex(self._REDIS_PREFIX + key, self._ttl_seconds, text)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+    def _sqlite_get(self, key: str) -> str | None:
+        with self._sqlite_lock:
+            connection = self._sqlite_connection()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("LLM cache read failed: %s", e)
+                return None
+        return row[0] if row else None
+
+    def _sqlite_set(self, key: str, text: str) -> None:
+        with self._sqlite_lock:
+            connection = self._sqlite_connection()
+            if connection is None:
+                return
+            now = time.time()
+            try:
+                with connection:
+                    # Expired rows are never read again; drop them on write so the file stays bounded.
+                    connection.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                    connection.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, text, now + self._ttl_seconds),
+                    )
+            except sqlite3.Error as e:
+                logger.warning("LLM cache write failed: %s", e)
+
+    def _remember(self, key: str, text: str) -> None:
+        if len(self._store) >= self._MAX_LOCAL_ENTRIES:
+            # Dicts preserve insertion order, so this drops the oldest entry.
+            self._store.pop(next(iter(self._store)))
+        self._store[key] = (text, time.monotonic() + self._ttl_seconds)
+
+
+_llm_cache = _LLMCache(
+    mode=settings.llm_cache_mode,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+    redis_url=settings.redis_url,
+    sqlite_path=settings.llm_cache_path,
+)
+
+
+def _is_cacheable(model: str, json_mode: bool) -> bool:
+    """Cache only deterministic calls: JSON output at temperature=0.
+
+    GPT-5 models reject a temperature setting and sample with a reasoning effort
+    instead, so their responses are not reproducible and are never cached.
+    """
+    return json_mode and not _is_gpt5_family_model(model)
+
+
+async def _acall_llm_text(
     system_prompt: str,
     user_prompt: str,
     max_tokens: int,
     model: str,
     json_mode: bool,
+    json_schema: dict[str, Any] | None = None,
 ) -> str:
-    provider = (settings.llm_provider or "openai").lower()
+    cache_key: str | None = None
+    if _is_cacheable(model, json_mode):
+        cache_key = _LLMCache.make_key(
+            provider=_PROVIDER,
+            model=model,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            json_mode=json_mode,
+            json_schema=json_schema,
+        )
+        cached = await _llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    try:
+        if _PROVIDER == "openai":
+            text = await _acall_openai(system_prompt, user_prompt, max_tokens, model, json_mode, json_schema)
+        elif _PROVIDER == "openrouter":
+            text = await _acall_openrouter(system_prompt, user_prompt, max_tokens, model, json_mode, json_schema)
+        else:
+            raise ValueError(f"Unsupported LLM_PROVIDER: {_PROVIDER}")
+    except _PROVIDER_ERRORS as e:
+        raise LLMError(str(e)) from e
+
+    if cache_key is not None:
+        await _llm_cache.set(cache_key, text)
+    return text
+
+
+_JSON_DECODER = json.JSONDecoder()
 
-    if provider == "openai":
-        return _call_openai(system_prompt, user_prompt, max_tokens, model, json_mode)
 
-    if provider == "openrouter":
-        return _call_openrouter(system_prompt, user_prompt, max_tokens, model, json_mode)
+def _strict_schema_node(node: Any) -> Any:
+    if isinstance(node, list):
+        return [_strict_schema_node(item) for item in node]
+    if not isinstance(node, dict):
+        return node
 
-    raise ValueError(f"Unsupported LLM_PROVIDER: {provider}")
+    strict_node: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("default", "title"):
+            continue
+        if key in ("properties", "$defs"):
+            strict_node[key] = {name: _strict_schema_node(child) for name, child in value.items()}
+        else:
+            strict_node[key] = _strict_schema_node(value)
+
+    if strict_node.get("type") == "object" and "properties" in strict_node:
+        # Strict structured outputs require every property to be listed as required
+        # (optional values are expressed as nullable types) and no extra keys.
+        strict_node["required"] = list(strict_node["properties"])
+        strict_node["additionalProperties"] = False
+    return strict_node
+
+
+@lru_cache(maxsize=32)
+def _response_json_schema(response_model: type[BaseModel]) -> dict[str, Any]:
+    """Build the strict structured-output schema for a Pydantic response model, once per model."""
+    return {
+        "name": response_model.__name__,
+        "schema": _strict_schema_node(response_model.model_json_schema(by_alias=True)),
+    }
 
 
 def parse_json_response(content: str) -> dict[str, Any]:
@@ -421,54 +1040,30 @@ def parse_json_response(content: str) -> dict[str, Any]:
 
     raw = content.strip()
 
-    def extract_first_json_object(text: str) -> str | None:
-        start_index = text.find("{")
-        if start_index < 0:
-            return None
-
-        depth = 0
-        in_string = False
-        escape = False
-        for index in range(start_index, len(text)):
-            ch = text[index]
-            if in_string:
-                if escape:
-                    escape = False
-                    continue
-                if ch == "\\":
-                    escape = True
-                    continue
-                if ch == '"':
-                    in_string = False
-                continue
-
-            if ch == '"':
-                in_string = True
-                continue
-            if ch == "{":
-                depth += 1
-                continue
-            if ch == "}":
-                depth -= 1
-                if depth == 0:
-                    return text[start_index : index + 1]
-
-        return None
-
     try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
-        extracted = extract_first_json_object(raw)
-        if not extracted:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        start_index = raw.find("{")
+        if start_index < 0:
             raise
-        parsed = json.loads(extracted)
+        # raw_decode runs the C scanner from the first brace and ignores trailing prose.
+        parsed, _ = _JSON_DECODER.raw_decode(raw, start_index)
 
     if not isinstance(parsed, dict):
         raise ValueError("Expected a JSON object")
     return parsed
 
 
-def call_llm(
+# One retry with stronger formatting instructions (helps occasional broken JSON). The retry
+# also doubles the output budget, since with structured outputs a parse failure almost
+# always means the response was cut off at max_tokens.
+_JSON_RETRY_INSTRUCTIONS = (
+    "\n\nIMPORTANT: Output ONLY valid JSON. Do not include markdown fences. "
+    "Escape any quotes inside strings. Never include trailing commas."
+)
+
+
+async def acall_llm(
     system_prompt: str,
     user_prompt: str,
     max_tokens: int = 1000,
@@ -476,7 +1071,7 @@ def call_llm(
 ) -> str:
     """Make a call to the LLM and return the text response."""
     resolved_model = model or settings.llm_model
-    return _call_llm_text(
+    return await _acall_llm_text(
         system_prompt=system_prompt,
         user_prompt=user_prompt,
         max_tokens=max_tokens,
@@ -485,45 +1080,48 @@ def call_llm(
     )
 
 
-def call_llm_json(
+async def acall_llm_json(
     system_prompt: str,
     user_prompt: str,
     max_tokens: int = 1000,
     model: str | None = None,
+    response_model: type[BaseModel] | None = None,
 ) -> dict[str, Any]:
-    """Make a call to the LLM and parse JSON response."""
+    """Make a call to the LLM and parse JSON response.
+
+    When ``response_model`` is given, decoding is constrained to its JSON schema
+    (structured outputs) instead of free-form JSON mode.
+    """
     resolved_model = model or settings.llm_model
-    content = _call_llm_text(
+    json_schema = _response_json_schema(response_model) if response_model else None
+    content = await _acall_llm_text(
         system_prompt=system_prompt,
         user_prompt=user_prompt,
         max_tokens=max_tokens,
         model=resolved_model,
         json_mode=True,
+        json_schema=json_schema,
     )
     try:
         return parse_json_response(content)
-    except Exception:
-        # One retry with stronger formatting instructions (helps occasional broken JSON).
-        retry_prompt = (
-            user_prompt
-            + "\n\nIMPORTANT: Output ONLY valid JSON. Do not include markdown fences. "
-            + "Escape any quotes inside strings. Never include trailing commas."
-        )
-        retry_content = _call_llm_text(
+    except ValueError:
+        retry_content = await _acall_llm_text(
             system_prompt=system_prompt,
-            user_prompt=retry_prompt,
-            max_tokens=max_tokens,
+            user_prompt=user_prompt + _JSON_RETRY_INSTRUCTIONS,
+            max_tokens=max_tokens * 2,
             model=resolved_model,
             json_mode=True,
+            json_schema=json_schema,
         )
-        return parse_json_response(retry_content)
+        try:
+            return parse_json_response(retry_content)
+        except ValueError as e:
+            raise LLMError(f"LLM returned invalid JSON: {e}") from e
 
 
 def _get_tool_calling_url() -> tuple[str, dict[str, str]]:
     """Return the (base_url, headers) for the configured provider's chat completions endpoint."""
-    provider = (settings.llm_provider or "openai").lower()
-
-    if provider == "openrouter":
+    if _PROVIDER == "openrouter":
         if not settings.openrouter_api_key:
             raise ValueError("OPENROUTER_API_KEY not configured")
         return (
@@ -538,36 +1136,51 @@ def _get_tool_calling_url() -> tuple[str, dict[str, str]]:
         raise ValueError("OPENAI_API_KEY not configured")
     return (
         "https://api.openai.com/v1/chat/completions",
-        {
-            "Authorization": f"Bearer {settings.openai_api_key}",
-            "Content-Type": "application/json",
-        },
+        _openai_headers(),
     )
 
 
-def _chat_completions_with_tools(
+def _build_tools_request_body(
     messages: list[dict[str, Any]],
     tools: list[dict[str, Any]],
     max_tokens: int,
     model: str,
 ) -> dict[str, Any]:
-    """Single chat completions call with tool definitions. Returns the raw payload."""
-    url, headers = _get_tool_calling_url()
-
     request_body: dict[str, Any] = {
         "model": model,
         "messages": messages,
-        "tools": tools,
         "max_tokens": max_tokens,
         "temperature": 0,
     }
+    # OpenAI rejects an empty tools array, which is what the final no-tools round sends.
+    if tools:
+        request_body["tools"] = tools
 
-    provider = (settings.llm_provider or "openai").lower()
-    if provider == "openrouter":
+    if _PROVIDER == "openrouter":
         request_body["provider"] = _openrouter_provider_prefs()
+    elif messages and messages[0].get("role") == "system":
+        request_body["prompt_cache_key"] = _prompt_cache_key(messages[0]["content"])
+    return request_body
+
 
-    with httpx.Client(timeout=120) as client:
-        response = client.post(url, headers=headers, json=request_body)
+async def _chat_completions_with_tools(
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]],
+    max_tokens: int,
+    model: str,
+) -> dict[str, Any]:
+    """Single chat completions call with tool definitions. Returns the raw payload."""
+    try:
+        url, headers = _get_tool_calling_url()
+        request_body = _build_tools_request_body(messages, tools, max_tokens, model)
+
+        async with _llm_semaphore:
+            response = await get_async_http_client().post(
+                url,
+                headers=headers,
+                content=orjson.dumps(request_body),
+                timeout=120,
+            )
 
         try:
             response.raise_for_status()
@@ -581,7 +1194,110 @@ def _chat_completions_with_tools(
             )
             raise
 
-        return response.json()
+        return orjson.loads(response.content)
+    except _PROVIDER_ERRORS as e:
+        raise LLMError(str(e)) from e
+
+
+async def _stream_chat_completions_with_tools(
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]],
+    max_tokens: int,
+    model: str,
+) -> AsyncIterator[dict[str, Any]]:
+    """Single streamed chat completions call with tool definitions. Yields each chunk payload."""
+    try:
+        url, headers = _get_tool_calling_url()
+        request_body = _build_tools_request_body(messages, tools, max_tokens, model)
+        request_body["stream"] = True
+
+        client = get_async_http_client()
+        request = client.build_request(
+            "POST",
+            url,
+            headers=headers,
+            content=orjson.dumps(request_body),
+            timeout=120,
+        )
+        # The semaphore only gates opening the stream; holding it while yielding would let a
+        # slow SSE consumer starve every other LLM call in the process.
+        async with _llm_semaphore:
+            response = await client.send(request, stream=True)
+    except _PROVIDER_ERRORS as e:
+        raise LLMError(str(e)) from e
+
+    try:
+        if response.is_error:
+            await response.aread()
+            logger.warning(
+                "Streaming tool-calling request failed (%s) model=%s: %s",
+                response.status_code,
+                model,
+                _format_openai_http_error(response),
+            )
+            response.raise_for_status()
+
+        # Server-sent events; OpenRouter also interleaves ": comment" keep-alive lines.
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            yield orjson.loads(data)
+    except _PROVIDER_ERRORS as e:
+        raise LLMError(str(e)) from e
+    finally:
+        await response.aclose()
+
+
+async def _run_tool_call(
+    tool_call: dict[str, Any],
+    tool_executor: Callable[[str, dict], Awaitable[dict]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Execute one requested tool call. Returns (tool_call_log_entry, tool_result_message)."""
+    function_data = tool_call.get("function", {})
+    tool_name = function_data.get("name", "")
+
+    try:
+        arguments = orjson.loads(function_data.get("arguments") or "{}")
+    except orjson.JSONDecodeError:
+        arguments = {}
+
+    logger.info("Executing tool: %s(%s)", tool_name, arguments)
+    result = await tool_executor(tool_name, arguments)
+
+    log_entry = {
+        "tool": tool_name,
+        "arguments": arguments,
+        "result": result,
+    }
+    tool_message = {
+        "role": "tool",
+        "tool_call_id": tool_call.get("id", ""),
+        "content": orjson.dumps(result).decode(),
+    }
+    return log_entry, tool_message
+
+
+async def _run_tool_calls(
+    tool_calls: list[dict[str, Any]],
+    tool_executor: Callable[[str, dict], Awaitable[dict]],
+    parallel_tools: Collection[str],
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Execute one assistant turn's tool calls, in request order.
+
+    Turns made only of tools listed in ``parallel_tools`` (read-only, IO-bound) run
+    concurrently, so wall time is the slowest call rather than the sum. A turn that
+    includes any other tool runs sequentially to keep side effects ordered.
+    """
+    if len(tool_calls) > 1 and all(
+        tool_call.get("function", {}).get("name") in parallel_tools for tool_call in tool_calls
+    ):
+        return list(await asyncio.gather(
+            *(_run_tool_call(tool_call, tool_executor) for tool_call in tool_calls)
+        ))
+    return [await _run_tool_call(tool_call, tool_executor) for tool_call in tool_calls]
 
 
 async def call_llm_with_tools(
@@ -591,19 +1307,20 @@ async def call_llm_with_tools(
     max_tokens: int = 1000,
     model: str | None = None,
     max_tool_rounds: int = 5,
+    parallel_tools: Collection[str] = frozenset(),
 ) -> tuple[str, list[dict[str, Any]]]:
     """Run a multi-turn tool-calling loop with the LLM.
 
     Returns (final_text_response, tool_call_log).
     Both OpenAI and OpenRouter use the same chat completions format.
+    Tools named in ``parallel_tools`` may run concurrently within one turn.
     """
     resolved_model = model or settings.llm_model
     tool_call_log: list[dict[str, Any]] = []
     working_messages = list(messages)
 
     for round_index in range(max_tool_rounds):
-        payload = await asyncio.to_thread(
-            _chat_completions_with_tools,
+        payload = await _chat_completions_with_tools(
             working_messages,
             tools,
             max_tokens,
@@ -626,37 +1343,15 @@ async def call_llm_with_tools(
 
         working_messages.append(assistant_message)
 
-        for tool_call in tool_calls:
-            function_data = tool_call.get("function", {})
-            tool_name = function_data.get("name", "")
-            tool_call_id = tool_call.get("id", "")
-
-            try:
-                arguments = json.loads(function_data.get("arguments", "{}"))
-            except json.JSONDecodeError:
-                arguments = {}
-
-            logger.info("Executing tool: %s(%s)", tool_name, arguments)
-            result = await tool_executor(tool_name, arguments)
-
-            tool_call_log.append({
-                "tool": tool_name,
-                "arguments": arguments,
-                "result": result,
-            })
-
-            working_messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call_id,
-                "content": json.dumps(result),
-            })
+        for log_entry, tool_message in await _run_tool_calls(tool_calls, tool_executor, parallel_tools):
+            tool_call_log.append(log_entry)
+            working_messages.append(tool_message)
 
         if finish_reason == "stop":
             content = assistant_message.get("content", "")
             return content or "Done.", tool_call_log
 
-    final_payload = await asyncio.to_thread(
-        _chat_completions_with_tools,
+    final_payload = await _chat_completions_with_tools(
         working_messages,
         [],
         max_tokens,
@@ -666,3 +1361,73 @@ async def call_llm_with_tools(
     if final_choices:
         return final_choices[0].get("message", {}).get("content", "Done."), tool_call_log
     return "Done.", tool_call_log
+
+
+async def stream_llm_with_tools(
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]],
+    tool_executor: Callable[[str, dict], Awaitable[dict]],
+    max_tokens: int = 1000,
+    model: str | None = None,
+    max_tool_rounds: int = 5,
+    parallel_tools: Collection[str] = frozenset(),
+) -> AsyncIterator[dict[str, Any]]:
+    """Streaming variant of call_llm_with_tools.
+
+    Yields {"type": "text", "delta": ...} as reply tokens arrive and
+    {"type": "tool_call", "tool": ..., "arguments": ..., "result": ...} after each tool runs,
+    so callers can show the first words at time-to-first-token instead of after the full reply.
+    """
+    resolved_model = model or settings.llm_model
+    working_messages = list(messages)
+
+    for round_index in range(max_tool_rounds + 1):
+        # After the tool budget is spent, ask for a final answer without tools.
+        round_tools = tools if round_index < max_tool_rounds else []
+        content_parts: list[str] = []
+        tool_calls_by_index: dict[int, dict[str, Any]] = {}
+
+        async for chunk in _stream_chat_completions_with_tools(
+            working_messages,
+            round_tools,
+            max_tokens,
+            resolved_model,
+        ):
+            choices = chunk.get("choices") or []
+            if not choices:
+                continue
+            delta = choices[0].get("delta") or {}
+
+            text_delta = delta.get("content")
+            if text_delta:
+                content_parts.append(text_delta)
+                yield {"type": "text", "delta": text_delta}
+
+            # Tool calls arrive in fragments keyed by index; the arguments string is split
+            # across chunks and only parses once the turn is complete.
+            for tool_call_delta in delta.get("tool_calls") or []:
+                tool_call = tool_calls_by_index.setdefault(
+                    tool_call_delta.get("index", 0),
+                    {"id": "", "type": "function", "function": {"name": "", "arguments": ""}},
+                )
+                if tool_call_delta.get("id"):
+                    tool_call["id"] = tool_call_delta["id"]
+                function_delta = tool_call_delta.get("function") or {}
+                tool_call["function"]["name"] += function_delta.get("name") or ""
+                tool_call["function"]["arguments"] += function_delta.get("arguments") or ""
+
+        if not tool_calls_by_index:
+            if not content_parts:
+                yield {"type": "text", "delta": "Done."}
+            return
+
+        tool_calls = [tool_calls_by_index[index] for index in sorted(tool_calls_by_index)]
+        working_messages.append({
+            "role": "assistant",
+            "content": "".join(content_parts) or None,
+            "tool_calls": tool_calls,
+        })
+
+        for log_entry, tool_message in await _run_tool_calls(tool_calls, tool_executor, parallel_tools):
+            working_messages.append(tool_message)
+            yield {"type": "tool_call", **log_entry}
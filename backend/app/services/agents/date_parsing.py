@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 
 from dateutil.parser import parse as dateutil_parse
 from dateutil.parser import ParserError
@@ -19,20 +20,18 @@ _WEEKDAY_NAMES = {
     "sunday": 6,
 }
 
-_RELATIVE_DAY_PATTERN = re.compile(
-    r"^(today|tomorrow|yesterday)(?:\s+at\s+(.+))?$", re.IGNORECASE
-)
-
-_NEXT_WEEKDAY_PATTERN = re.compile(
-    r"^next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
-    r"(?:\s+at\s+(.+))?$",
+# One alternation with named groups so a non-matching input is scanned once
+# instead of once per supported phrase.
+_NATURAL_PHRASE_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<day_word>today|tomorrow|yesterday)(?:\s+at\s+(?P<day_time>.+))?"
+    r"|next\s+(?P<weekday>monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
+    r"(?:\s+at\s+(?P<weekday_time>.+))?"
+    r"|in\s+(?P<amount>\d+)\s+(?P<unit>minute|hour|day|week)s?"
+    r")$",
     re.IGNORECASE,
 )
 
-_IN_DURATION_PATTERN = re.compile(
-    r"^in\s+(\d+)\s+(minute|hour|day|week)s?$", re.IGNORECASE
-)
-
 
 def _apply_time_string(base_date: datetime, time_str: str) -> datetime:
     """Parse a time-of-day string and apply it to a date."""
@@ -49,6 +48,19 @@ def _apply_time_string(base_date: datetime, time_str: str) -> datetime:
         return base_date
 
 
+@lru_cache(maxsize=4096)
+def _parse_with_dateutil(cleaned: str, today_iso: str) -> datetime:
+    """Parse a free-form datetime with dateutil.
+
+    dateutil fills missing fields from the current date, so ``today_iso`` is part of
+    the cache key to keep memoized results exact across midnight.
+    """
+    parsed = dateutil_parse(cleaned)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
 def parse_flexible_datetime(
     value: str,
     reference_time: datetime | None = None,
@@ -67,41 +79,41 @@ def parse_flexible_datetime(
     reference = reference_time or datetime.now(timezone.utc)
     cleaned = value.strip()
 
-    relative_match = _RELATIVE_DAY_PATTERN.match(cleaned)
-    if relative_match:
-        day_word = relative_match.group(1).lower()
-        time_part = relative_match.group(2)
-
-        if day_word == "today":
-            base = reference
-        elif day_word == "tomorrow":
-            base = reference + timedelta(days=1)
-        else:
-            base = reference - timedelta(days=1)
-
-        base = base.replace(hour=9, minute=0, second=0, microsecond=0)
-        if time_part:
-            base = _apply_time_string(base, time_part)
-        return base
-
-    next_weekday_match = _NEXT_WEEKDAY_PATTERN.match(cleaned)
-    if next_weekday_match:
-        target_day = _WEEKDAY_NAMES[next_weekday_match.group(1).lower()]
-        time_part = next_weekday_match.group(2)
-        current_day = reference.weekday()
-        days_ahead = (target_day - current_day) % 7
-        if days_ahead == 0:
-            days_ahead = 7
-        base = reference + timedelta(days=days_ahead)
-        base = base.replace(hour=9, minute=0, second=0, microsecond=0)
-        if time_part:
-            base = _apply_time_string(base, time_part)
-        return base
-
-    duration_match = _IN_DURATION_PATTERN.match(cleaned)
-    if duration_match:
-        amount = int(duration_match.group(1))
-        unit = duration_match.group(2).lower()
+    phrase_match = _NATURAL_PHRASE_PATTERN.match(cleaned)
+    if phrase_match:
+        day_word = phrase_match.group("day_word")
+        if day_word:
+            day_word = day_word.lower()
+            time_part = phrase_match.group("day_time")
+
+            if day_word == "today":
+                base = reference
+            elif day_word == "tomorrow":
+                base = reference + timedelta(days=1)
+            else:
+                base = reference - timedelta(days=1)
+
+            base = base.replace(hour=9, minute=0, second=0, microsecond=0)
+            if time_part:
+                base = _apply_time_string(base, time_part)
+            return base
+
+        weekday = phrase_match.group("weekday")
+        if weekday:
+            target_day = _WEEKDAY_NAMES[weekday.lower()]
+            time_part = phrase_match.group("weekday_time")
+            current_day = reference.weekday()
+            days_ahead = (target_day - current_day) % 7
+            if days_ahead == 0:
+                days_ahead = 7
+            base = reference + timedelta(days=days_ahead)
+            base = base.replace(hour=9, minute=0, second=0, microsecond=0)
+            if time_part:
+                base = _apply_time_string(base, time_part)
+            return base
+
+        amount = int(phrase_match.group("amount"))
+        unit = phrase_match.group("unit").lower()
         delta_map = {
             "minute": timedelta(minutes=amount),
             "hour": timedelta(hours=amount),
@@ -110,10 +122,18 @@ def parse_flexible_datetime(
         }
         return reference + delta_map[unit]
 
+    # Fast path for well-formed ISO 8601 (what the LLM tool schemas ask for);
+    # Python 3.11+ fromisoformat also accepts the "Z" suffix.
     try:
-        parsed = dateutil_parse(cleaned)
+        parsed = datetime.fromisoformat(cleaned)
+    except ValueError:
+        pass
+    else:
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed
+
+    try:
+        return _parse_with_dateutil(cleaned, date.today().isoformat())
     except (ParserError, ValueError) as parse_error:
         raise ValueError(f"Could not parse datetime: '{value}'") from parse_error
@@ -1,16 +1,122 @@
-"""Email intelligence agent for categorization, reply generation, TLDR digests, and subscription detection."""
+"""Email intelligence agent for categorization, reply generation, TLDR digests, and subscription detection.
+
+Operations are async and await the LLM without a worker thread, so independent calls
+from one request can run concurrently.
+"""
 
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import logging
-from typing import Any
+import re
+from collections import Counter
+from itertools import islice
+from typing import Literal
+
+import orjson
+from pydantic import BaseModel, Field
 
-from app.services.agents.base import call_llm_json, call_llm
+from app.services.agents.base import LLMError, acall_llm_json
 
 logger = logging.getLogger(__name__)
 
+# Large inputs are split into small prompts that run concurrently: several short
+# prefills finish sooner than one long one, and a shard failing only loses that
+# shard's results.
+_SHARD_SIZE = 10
+_MAX_CATEGORIZE_EMAILS = 30
+_MAX_TLDR_EMAILS = 40
+_MAX_TODO_EMAILS = 40
+_MAX_SUBSCRIPTION_EMAILS = 50
+_MAX_TODOS = 15
+_MAX_REPORT_EMAILS = 50
+_MAX_REPORT_TODOS = 30
+
+GMAIL_INBOX_PREFIX = "https://mail.google.com/mail/u/0/#inbox/"
+
+
+def _unique_emails(emails: list[dict], limit: int | None = None) -> list[dict]:
+    """Drop repeated message_ids, keeping order, and stop after ``limit`` distinct emails.
+
+    Gmail can list the same message more than once, and every repeat costs prompt tokens
+    and a slot under the per-operation cap.
+    """
+    seen_ids: set[str] = set()
+    unique: list[dict] = []
+    for email_item in emails:
+        message_id = email_item.get("message_id")
+        if message_id:
+            if message_id in seen_ids:
+                continue
+            seen_ids.add(message_id)
+        unique.append(email_item)
+        if len(unique) == limit:
+            break
+    return unique
+
+
+def _shard_emails(emails: list[dict], limit: int) -> list[list[dict]]:
+    """Split the first ``limit`` distinct emails into prompt-sized shards."""
+    capped = _unique_emails(emails, limit)
+    return [capped[i:i + _SHARD_SIZE] for i in range(0, len(capped), _SHARD_SIZE)]
+
+
+def _output_token_budget(item_count: int, per_item: int, base: int, cap: int) -> int:
+    """Scale max_tokens with the batch so small inboxes don't reserve the full cap."""
+    return min(cap, base + per_item * item_count)
+
+
+# Prompt fields as (summary key, email keys tried in order, max length or None).
+_EmailFields = tuple[tuple[str, tuple[str, ...], int | None], ...]
+
+_CATEGORIZE_FIELDS: _EmailFields = (
+    ("message_id", ("message_id",), None),
+    ("subject", ("subject",), None),
+    ("from", ("from_email",), None),
+    ("from_name", ("from_name",), None),
+    ("snippet", ("snippet",), 200),
+    ("date", ("date",), None),
+)
+_TLDR_FIELDS: _EmailFields = (
+    ("subject", ("subject",), None),
+    ("from", ("from_name", "from_email"), None),
+    ("snippet", ("snippet",), 300),
+    ("date", ("date",), None),
+    ("body_preview", ("body_preview",), 500),
+)
+_TODO_FIELDS: _EmailFields = (("message_id", ("message_id",), None), *_TLDR_FIELDS)
+_DAILY_REPORT_FIELDS: _EmailFields = (
+    ("subject", ("subject",), None),
+    ("from", ("from_name", "from_email"), None),
+    ("snippet", ("snippet",), 300),
+    ("date", ("date",), None),
+    ("category", ("category",), None),
+    ("priority", ("priority",), None),
+)
+_SUBSCRIPTION_FIELDS: _EmailFields = (
+    ("subject", ("subject",), None),
+    ("from", ("from_name", "from_email"), None),
+    ("snippet", ("snippet",), 300),
+    ("date", ("date",), None),
+    ("body_preview", ("body_preview",), 800),
+)
+
+
+def _summarize_emails(emails: list[dict], fields: _EmailFields) -> list[dict]:
+    """Project emails onto prompt fields, truncating long text and leaving out empty values."""
+    summaries = []
+    for email_item in emails:
+        summary = {}
+        for key, sources, max_len in fields:
+            for source in sources:
+                value = email_item.get(source)
+                if value:
+                    summary[key] = value[:max_len] if max_len and isinstance(value, str) else value
+                    break
+        summaries.append(summary)
+    return summaries
+
 # ---------------------------------------------------------------------------
 # Email categorization
 # ---------------------------------------------------------------------------
@@ -34,50 +140,162 @@ For each email, output:
 Output JSON: {"emails": [{"message_id": "...", "category": "...", "priority": 1, "reason": "..."}]}"""
 
 
-def categorize_emails(emails: list[dict]) -> list[dict]:
-    """Categorize a list of emails using LLM. Returns augmented email dicts."""
-    if not emails:
-        return []
+class CategorizedEmail(BaseModel):
+    message_id: str
+    category: Literal["needs_reply", "meeting_related", "urgent", "newsletter", "subscription", "informational"]
+    priority: int
+    reason: str
 
-    email_summaries = []
-    for e in emails[:30]:  # Limit to 30 for token budget
-        email_summaries.append({
-            "message_id": e.get("message_id", ""),
-            "subject": e.get("subject", ""),
-            "from": e.get("from_email", ""),
-            "from_name": e.get("from_name", ""),
-            "snippet": e.get("snippet", "")[:200],
-            "date": e.get("date", ""),
-        })
 
-    user_prompt = f"Categorize these emails:\n{json.dumps(email_summaries, indent=2)}"
+class CategorizeResult(BaseModel):
+    emails: list[CategorizedEmail]
 
-    try:
-        result = call_llm_json(CATEGORIZE_SYSTEM_PROMPT, user_prompt, max_tokens=2000)
-        categories = {
-            item["message_id"]: item
-            for item in result.get("emails", [])
-            if isinstance(item, dict) and "message_id" in item
-        }
-    except Exception:
-        logger.exception("Email categorization failed")
-        categories = {}
+
+def _categorize_user_prompt(emails: list[dict]) -> str:
+    email_summaries = _summarize_emails(emails, _CATEGORIZE_FIELDS)
+    return f"Categorize these emails:\n{orjson.dumps(email_summaries).decode()}"
+
+
+_UNCATEGORIZED = {"category": "informational", "priority": 5, "category_reason": ""}
+
+
+def _merge_categories(emails: list[dict], items: list[dict]) -> list[dict]:
+    categories = {
+        item["message_id"]: item
+        for item in items
+        if isinstance(item, dict) and "message_id" in item
+    }
+    # Every shard failed (or nothing came back): stamp the defaults without per-email lookups.
+    if not categories:
+        return [{**e, **_UNCATEGORIZED} for e in emails]
 
     # Merge categories back into original email dicts
     output = []
     for e in emails:
-        mid = e.get("message_id", "")
-        cat = categories.get(mid, {})
+        item = categories.get(e.get("message_id", ""))
+        if item is None:
+            output.append({**e, **_UNCATEGORIZED})
+            continue
         output.append({
             **e,
-            "category": cat.get("category", "informational"),
-            "priority": cat.get("priority", 5),
-            "category_reason": cat.get("reason", ""),
+            "category": item.get("category", "informational"),
+            "priority": item.get("priority", 5),
+            "category_reason": item.get("reason", ""),
         })
 
     return output
 
 
+# Categories of emails seen before, keyed by a hash of the fields the model sees, so
+# re-categorizing an inbox only sends new or changed emails to the LLM.
+_MAX_CATEGORY_CACHE_ENTRIES = 4096
+_category_cache: dict[str, dict] = {}
+
+
+def _category_cache_key(email_item: dict) -> str:
+    material = "\x1f".join((
+        email_item.get("message_id") or "",
+        email_item.get("subject") or "",
+        (email_item.get("snippet") or "")[:200],
+    ))
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Bulk mail from automated senders is usually obvious from the subject and snippet;
+# those emails are labelled by rule so the LLM only sees the ambiguous ones. Mail
+# from people always goes to the LLM, since "invoice" there may still need a reply.
+_RULE_CATEGORIES = (
+    (
+        "subscription",
+        4,
+        re.compile(r"\b(?:receipts?|invoices?|renewals?|subscriptions?|billing|payment received)\b", re.IGNORECASE),
+    ),
+    (
+        "newsletter",
+        5,
+        re.compile(r"\b(?:newsletters?|digest|weekly update|unsubscribe)\b", re.IGNORECASE),
+    ),
+)
+
+
+def _rule_category(email_item: dict) -> dict | None:
+    message_id = email_item.get("message_id")
+    if not message_id or not email_item.get("is_automated"):
+        return None
+    text = f"{email_item.get('subject') or ''}\n{email_item.get('snippet') or ''}"
+    for category, priority, pattern in _RULE_CATEGORIES:
+        match = pattern.search(text)
+        if match:
+            return {
+                "message_id": message_id,
+                "category": category,
+                "priority": priority,
+                "reason": f"Automated sender; mentions '{match.group(0).lower()}'",
+            }
+    return None
+
+
+def _partition_known_categories(emails: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Split emails into rule-labelled or cached category items and emails that still need the LLM."""
+    cached_items: list[dict] = []
+    uncached_emails: list[dict] = []
+    for email_item in emails:
+        known = _rule_category(email_item) or _category_cache.get(_category_cache_key(email_item))
+        if known is None:
+            uncached_emails.append(email_item)
+        else:
+            cached_items.append(known)
+    return cached_items, uncached_emails
+
+
+def _remember_categories(emails: list[dict], items: list[dict]) -> None:
+    categories = {
+        item["message_id"]: item
+        for item in items
+        if isinstance(item, dict) and "message_id" in item
+    }
+    for email_item in emails:
+        message_id = email_item.get("message_id")
+        item = categories.get(message_id) if message_id else None
+        if item is None:
+            continue
+        if len(_category_cache) >= _MAX_CATEGORY_CACHE_ENTRIES:
+            # Dicts preserve insertion order, so this drops the oldest entry.
+            _category_cache.pop(next(iter(_category_cache)))
+        _category_cache[_category_cache_key(email_item)] = item
+
+
+async def _acategorize_shard(shard: list[dict]) -> list[dict]:
+    try:
+        result = await acall_llm_json(
+            CATEGORIZE_SYSTEM_PROMPT,
+            _categorize_user_prompt(shard),
+            max_tokens=_output_token_budget(len(shard), per_item=120, base=200, cap=1400),
+            response_model=CategorizeResult,
+        )
+    except LLMError as e:
+        logger.warning("Email categorization failed: %s", e)
+        return []
+    return result.get("emails") or []
+
+
+async def acategorize_emails(emails: list[dict]) -> list[dict]:
+    """Categorize a list of emails using LLM. Returns augmented email dicts.
+
+    Shards are categorized concurrently.
+    """
+    if not emails:
+        return []
+
+    cached_items, uncached_emails = _partition_known_categories(emails)
+    shard_items = await asyncio.gather(
+        *(_acategorize_shard(shard) for shard in _shard_emails(uncached_emails, _MAX_CATEGORIZE_EMAILS))
+    )
+    new_items = [item for items in shard_items for item in items]
+    _remember_categories(uncached_emails, new_items)
+    return _merge_categories(emails, cached_items + new_items)
+
+
 # ---------------------------------------------------------------------------
 # Reply generation
 # ---------------------------------------------------------------------------
@@ -93,22 +311,40 @@ Rules:
 Output JSON: {"subject": "Re: ...", "body": "...", "tone": "formal|casual|friendly"}"""
 
 
-def generate_reply(email_data: dict, user_name: str = "") -> dict:
-    """Generate a reply suggestion for an email."""
-    user_prompt = (
+class ReplyResult(BaseModel):
+    subject: str
+    body: str
+    tone: Literal["formal", "casual", "friendly"]
+
+
+def _reply_user_prompt(email_data: dict, user_name: str) -> str:
+    body = email_data.get("body_preview") or email_data.get("snippet", "")
+    return (
         f"Original email:\n"
         f"From: {email_data.get('from_name', '')} <{email_data.get('from_email', '')}>\n"
         f"Subject: {email_data.get('subject', '')}\n"
         f"Date: {email_data.get('date', '')}\n"
-        f"Body:\n{email_data.get('body_preview', email_data.get('snippet', ''))}\n\n"
+        f"Body:\n{body}\n\n"
         f"Reply as: {user_name or 'the user'}"
     )
 
+
+def _fallback_reply(email_data: dict) -> dict:
+    return {"subject": f"Re: {email_data.get('subject', '')}", "body": "", "tone": "formal"}
+
+
+async def agenerate_reply(email_data: dict, user_name: str = "") -> dict:
+    """Generate a reply suggestion for an email."""
     try:
-        return call_llm_json(REPLY_SYSTEM_PROMPT, user_prompt, max_tokens=500)
-    except Exception:
-        logger.exception("Reply generation failed")
-        return {"subject": f"Re: {email_data.get('subject', '')}", "body": "", "tone": "formal"}
+        return await acall_llm_json(
+            REPLY_SYSTEM_PROMPT,
+            _reply_user_prompt(email_data, user_name),
+            max_tokens=500,
+            response_model=ReplyResult,
+        )
+    except LLMError as e:
+        logger.warning("Reply generation failed: %s", e)
+        return _fallback_reply(email_data)
 
 
 # ---------------------------------------------------------------------------
@@ -134,27 +370,37 @@ Focus on the most important and actionable emails. Skip automated notifications
 Limit to the top 10 most important highlights."""
 
 
-def create_tldr_digest(emails: list[dict]) -> dict:
+class TLDRHighlight(BaseModel):
+    subject: str
+    sender: str = Field(alias="from")
+    gist: str
+    action_needed: bool
+
+
+class TLDRResult(BaseModel):
+    summary: str
+    highlights: list[TLDRHighlight]
+
+
+def _tldr_user_prompt(emails: list[dict]) -> str:
+    email_summaries = _summarize_emails(_unique_emails(emails, _MAX_TLDR_EMAILS), _TLDR_FIELDS)
+    return f"Create a TLDR digest for these recent emails:\n{orjson.dumps(email_summaries).decode()}"
+
+
+async def acreate_tldr_digest(emails: list[dict]) -> dict:
     """Create a TLDR digest from a list of emails."""
     if not emails:
         return {"summary": "No emails to summarize.", "highlights": []}
 
-    email_summaries = []
-    for e in emails[:40]:
-        email_summaries.append({
-            "subject": e.get("subject", ""),
-            "from": e.get("from_name") or e.get("from_email", ""),
-            "snippet": e.get("snippet", "")[:300],
-            "date": e.get("date", ""),
-            "body_preview": (e.get("body_preview", "") or "")[:500],
-        })
-
-    user_prompt = f"Create a TLDR digest for these recent emails:\n{json.dumps(email_summaries, indent=2)}"
-
     try:
-        return call_llm_json(TLDR_SYSTEM_PROMPT, user_prompt, max_tokens=2000)
-    except Exception:
-        logger.exception("TLDR digest creation failed")
+        return await acall_llm_json(
+            TLDR_SYSTEM_PROMPT,
+            _tldr_user_prompt(emails),
+            max_tokens=_output_token_budget(min(len(emails), _MAX_TLDR_EMAILS), per_item=120, base=300, cap=2000),
+            response_model=TLDRResult,
+        )
+    except LLMError as e:
+        logger.warning("TLDR digest creation failed: %s", e)
         return {"summary": "Failed to generate digest.", "highlights": []}
 
 
@@ -186,6 +432,20 @@ Rules:
 - Deduplicate services (only list each service once with the latest info)"""
 
 
+class DetectedSubscription(BaseModel):
+    service_name: str
+    amount: str | None
+    currency: str | None
+    renewal_date: str | None
+    frequency: str | None
+    status: str | None
+    source_subject: str | None
+
+
+class SubscriptionsResult(BaseModel):
+    subscriptions: list[DetectedSubscription]
+
+
 # ---------------------------------------------------------------------------
 # Todo extraction from emails
 # ---------------------------------------------------------------------------
@@ -222,39 +482,85 @@ Rules:
 - If existing tasks are provided, do NOT create duplicates or near-duplicates of them"""
 
 
-def extract_todos(emails: list[dict], existing_todos: list[str] | None = None) -> dict:
-    """Extract actionable to-do items from emails, skipping duplicates of existing todos."""
-    if not emails:
-        return {"todos": []}
+class ExtractedTodo(BaseModel):
+    text: str
+    source: str
+    message_id: str
+    priority: int
+    deadline: str | None
 
-    email_summaries = []
-    for email_item in emails[:40]:
-        email_summaries.append({
-            "message_id": email_item.get("message_id", ""),
-            "subject": email_item.get("subject", ""),
-            "from": email_item.get("from_name") or email_item.get("from_email", ""),
-            "snippet": email_item.get("snippet", "")[:300],
-            "date": email_item.get("date", ""),
-            "body_preview": (email_item.get("body_preview", "") or "")[:500],
-        })
 
-    user_prompt = f"Extract actionable to-do items from these recent emails:\n{json.dumps(email_summaries, indent=2)}"
+class TodosResult(BaseModel):
+    todos: list[ExtractedTodo]
+
+
+def _todos_user_prompt(emails: list[dict], existing_todos: list[str] | None) -> str:
+    email_summaries = _summarize_emails(emails, _TODO_FIELDS)
+    user_prompt = f"Extract actionable to-do items from these recent emails:\n{orjson.dumps(email_summaries).decode()}"
 
     if existing_todos:
-        user_prompt += f"\n\nThe user already has these tasks — do NOT create duplicates or near-duplicates:\n{json.dumps(existing_todos)}"
+        user_prompt += f"\n\nThe user already has these tasks — do NOT create duplicates or near-duplicates:\n{orjson.dumps(existing_todos).decode()}"
+
+    return user_prompt
+
+
+def _todo_priority(todo_item: dict) -> int:
+    priority = todo_item.get("priority")
+    return priority if isinstance(priority, int) else 5
+
 
+def _merge_todos(shard_todos: list[list[dict]]) -> dict:
+    """Combine per-shard todos: drop repeats, keep the most urgent, add Gmail links."""
+    seen_texts: set[str] = set()
+    todos: list[dict] = []
+    for items in shard_todos:
+        for todo_item in items:
+            if not isinstance(todo_item, dict):
+                continue
+            text_key = str(todo_item.get("text", "")).strip().lower()
+            if not text_key or text_key in seen_texts:
+                continue
+            seen_texts.add(text_key)
+            todos.append(todo_item)
+
+    todos.sort(key=_todo_priority)
+    todos = todos[:_MAX_TODOS]
+    for todo_item in todos:
+        message_id = todo_item.get("message_id")
+        if message_id:
+            todo_item["link"] = GMAIL_INBOX_PREFIX + message_id
+    return {"todos": todos}
+
+
+async def _aextract_todos_shard(shard: list[dict], existing_todos: list[str] | None) -> list[dict]:
     try:
-        result = call_llm_json(TODOS_SYSTEM_PROMPT, user_prompt, max_tokens=2000)
-        todos = result.get("todos", [])
-        for todo_item in todos:
-            message_id = todo_item.get("message_id")
-            if message_id:
-                todo_item["link"] = f"https://mail.google.com/mail/u/0/#inbox/{message_id}"
-        return {"todos": todos}
-    except Exception:
-        logger.exception("Todo extraction failed")
+        result = await acall_llm_json(
+            TODOS_SYSTEM_PROMPT,
+            _todos_user_prompt(shard, existing_todos),
+            # Up to _MAX_TODOS todos can come back from one shard, each with text, source,
+            # message_id, priority and deadline, so the floor covers that even for small shards.
+            max_tokens=_output_token_budget(len(shard), per_item=120, base=1200, cap=2400),
+            response_model=TodosResult,
+        )
+    except LLMError as e:
+        logger.warning("Todo extraction failed: %s", e)
+        return []
+    return result.get("todos") or []
+
+
+async def aextract_todos(emails: list[dict], existing_todos: list[str] | None = None) -> dict:
+    """Extract actionable to-do items from emails, skipping duplicates of existing todos.
+
+    Shards are processed concurrently.
+    """
+    if not emails:
         return {"todos": []}
 
+    shard_todos = await asyncio.gather(
+        *(_aextract_todos_shard(shard, existing_todos) for shard in _shard_emails(emails, _MAX_TODO_EMAILS))
+    )
+    return _merge_todos(list(shard_todos))
+
 
 # ---------------------------------------------------------------------------
 # Daily report generation
@@ -265,15 +571,6 @@ DAILY_REPORT_SYSTEM_PROMPT = """You are a daily email report assistant. Given ca
 Output JSON:
 {
   "summary": "2-3 sentence overview of the day's email activity",
-  "email_stats": {
-    "total": 0,
-    "needs_reply": 0,
-    "urgent": 0,
-    "meeting_related": 0,
-    "newsletter": 0,
-    "subscription": 0,
-    "informational": 0
-  },
   "highlights": [
     {
       "subject": "email subject",
@@ -304,6 +601,7 @@ Output JSON:
 }
 
 Rules:
+- Email counts per category are given in the input; use them as-is and do not recount
 - Focus on the most important and actionable items
 - Highlights should be limited to the top 8 most notable emails
 - Action items should combine email-derived tasks and existing todos
@@ -311,31 +609,69 @@ Rules:
 - Be concise but informative"""
 
 
-def generate_daily_report(categorized_emails: list[dict], todos: list[dict]) -> dict:
-    """Generate a daily report from categorized emails and todos."""
-    if not categorized_emails and not todos:
-        return {
-            "summary": "No emails or tasks to report on today.",
-            "email_stats": {"total": 0, "needs_reply": 0, "urgent": 0, "meeting_related": 0, "newsletter": 0, "subscription": 0, "informational": 0},
-            "highlights": [],
-            "action_items": {"completed": 0, "pending": 0, "items": []},
-            "upcoming": [],
-            "wrap_up": "Nothing on the radar today. Enjoy the quiet!",
-        }
-
-    email_summaries = []
-    for email_item in categorized_emails[:50]:
-        email_summaries.append({
-            "subject": email_item.get("subject", ""),
-            "from": email_item.get("from_name") or email_item.get("from_email", ""),
-            "snippet": email_item.get("snippet", "")[:300],
-            "date": email_item.get("date", ""),
-            "category": email_item.get("category", "informational"),
-            "priority": email_item.get("priority", 5),
-        })
+class ReportHighlight(BaseModel):
+    subject: str
+    sender: str = Field(alias="from")
+    gist: str
+    priority: Literal["high", "medium", "low"]
+
+
+class ActionItem(BaseModel):
+    text: str
+    status: Literal["completed", "pending"]
+    source: str
+
+
+class ActionItems(BaseModel):
+    completed: int
+    pending: int
+    items: list[ActionItem]
+
+
+class UpcomingItem(BaseModel):
+    text: str
+    date: str | None
+    source: str
+
+
+class DailyReportResult(BaseModel):
+    summary: str
+    highlights: list[ReportHighlight]
+    action_items: ActionItems
+    upcoming: list[UpcomingItem]
+    wrap_up: str
+
+
+_EMAIL_CATEGORIES = ("needs_reply", "urgent", "meeting_related", "newsletter", "subscription", "informational")
+
+
+def _email_stats(categorized_emails: list[dict]) -> dict[str, int]:
+    """Count emails per category; exact counting is not a job for the LLM."""
+    unique_emails = _unique_emails(categorized_emails)
+    counts = Counter(email_item.get("category", "informational") for email_item in unique_emails)
+    return {"total": len(unique_emails), **{category: counts[category] for category in _EMAIL_CATEGORIES}}
+
+
+def _empty_daily_report(summary: str, wrap_up: str, email_stats: dict[str, int]) -> dict:
+    return {
+        "summary": summary,
+        "email_stats": email_stats,
+        "highlights": [],
+        "action_items": {"completed": 0, "pending": 0, "items": []},
+        "upcoming": [],
+        "wrap_up": wrap_up,
+    }
+
+
+def _daily_report_user_prompt(
+    categorized_emails: list[dict],
+    todos: list[dict],
+    email_stats: dict[str, int],
+) -> str:
+    email_summaries = _summarize_emails(_unique_emails(categorized_emails, _MAX_REPORT_EMAILS), _DAILY_REPORT_FIELDS)
 
     todo_summaries = []
-    for todo_item in todos[:30]:
+    for todo_item in islice(todos, _MAX_REPORT_TODOS):
         todo_summaries.append({
             "text": todo_item.get("text", ""),
             "completed": todo_item.get("completed", False),
@@ -343,46 +679,91 @@ def generate_daily_report(categorized_emails: list[dict], todos: list[dict]) ->
             "priority": todo_item.get("priority", 3),
         })
 
-    user_prompt = (
+    return (
         f"Generate a daily report.\n\n"
-        f"Categorized emails ({len(email_summaries)}):\n{json.dumps(email_summaries, indent=2)}\n\n"
-        f"Current todos ({len(todo_summaries)}):\n{json.dumps(todo_summaries, indent=2)}"
+        f"Email counts by category: {orjson.dumps(email_stats).decode()}\n\n"
+        f"Categorized emails ({len(email_summaries)}):\n{orjson.dumps(email_summaries).decode()}\n\n"
+        f"Current todos ({len(todo_summaries)}):\n{orjson.dumps(todo_summaries).decode()}"
     )
 
+
+async def agenerate_daily_report(categorized_emails: list[dict], todos: list[dict]) -> dict:
+    """Generate a daily report from categorized emails and todos."""
+    email_stats = _email_stats(categorized_emails)
+    if not categorized_emails and not todos:
+        return _empty_daily_report(
+            "No emails or tasks to report on today.",
+            "Nothing on the radar today. Enjoy the quiet!",
+            email_stats,
+        )
+
     try:
-        return call_llm_json(DAILY_REPORT_SYSTEM_PROMPT, user_prompt, max_tokens=3000)
-    except Exception:
-        logger.exception("Daily report generation failed")
-        return {
-            "summary": "Failed to generate daily report.",
-            "email_stats": {"total": 0, "needs_reply": 0, "urgent": 0, "meeting_related": 0, "newsletter": 0, "subscription": 0, "informational": 0},
-            "highlights": [],
-            "action_items": {"completed": 0, "pending": 0, "items": []},
-            "upcoming": [],
-            "wrap_up": "",
-        }
-
-
-def detect_subscriptions(emails: list[dict]) -> list[dict]:
-    """Detect subscriptions and billing from emails."""
-    if not emails:
+        report = await acall_llm_json(
+            DAILY_REPORT_SYSTEM_PROMPT,
+            _daily_report_user_prompt(categorized_emails, todos, email_stats),
+            max_tokens=_output_token_budget(
+                min(len(categorized_emails), _MAX_REPORT_EMAILS) + min(len(todos), _MAX_REPORT_TODOS),
+                per_item=60,
+                base=800,
+                cap=3000,
+            ),
+            response_model=DailyReportResult,
+        )
+    except LLMError as e:
+        logger.warning("Daily report generation failed: %s", e)
+        return _empty_daily_report("Failed to generate daily report.", "", email_stats)
+    report["email_stats"] = email_stats
+    return report
+
+
+def _subscriptions_user_prompt(emails: list[dict]) -> str:
+    email_summaries = _summarize_emails(emails, _SUBSCRIPTION_FIELDS)
+    return f"Extract subscriptions and bills from these emails:\n{orjson.dumps(email_summaries).decode()}"
+
+
+def _merge_subscriptions(shard_subscriptions: list[list[dict]]) -> list[dict]:
+    """Combine per-shard results, keeping the first entry seen for each service.
+
+    Emails arrive newest first, so the first entry carries the latest info.
+    """
+    seen_services: set[str] = set()
+    subscriptions: list[dict] = []
+    for items in shard_subscriptions:
+        for subscription in items:
+            if not isinstance(subscription, dict):
+                continue
+            service_key = str(subscription.get("service_name") or "").strip().lower()
+            if service_key:
+                if service_key in seen_services:
+                    continue
+                seen_services.add(service_key)
+            subscriptions.append(subscription)
+    return subscriptions
+
+
+async def _adetect_subscriptions_shard(shard: list[dict]) -> list[dict]:
+    try:
+        result = await acall_llm_json(
+            SUBSCRIPTION_SYSTEM_PROMPT,
+            _subscriptions_user_prompt(shard),
+            max_tokens=_output_token_budget(len(shard), per_item=80, base=200, cap=1000),
+            response_model=SubscriptionsResult,
+        )
+    except LLMError as e:
+        logger.warning("Subscription detection failed: %s", e)
         return []
+    return result.get("subscriptions") or []
 
-    email_summaries = []
-    for e in emails[:50]:
-        email_summaries.append({
-            "subject": e.get("subject", ""),
-            "from": e.get("from_name") or e.get("from_email", ""),
-            "snippet": e.get("snippet", "")[:300],
-            "date": e.get("date", ""),
-            "body_preview": (e.get("body_preview", "") or "")[:800],
-        })
 
-    user_prompt = f"Extract subscriptions and bills from these emails:\n{json.dumps(email_summaries, indent=2)}"
+async def adetect_subscriptions(emails: list[dict]) -> list[dict]:
+    """Detect subscriptions and billing from emails.
 
-    try:
-        result = call_llm_json(SUBSCRIPTION_SYSTEM_PROMPT, user_prompt, max_tokens=2000)
-        return result.get("subscriptions", [])
-    except Exception:
-        logger.exception("Subscription detection failed")
+    Shards are processed concurrently.
+    """
+    if not emails:
         return []
+
+    shard_subscriptions = await asyncio.gather(
+        *(_adetect_subscriptions_shard(shard) for shard in _shard_emails(emails, _MAX_SUBSCRIPTION_EMAILS))
+    )
+    return _merge_subscriptions(list(shard_subscriptions))
@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from collections.abc import AsyncIterator
 from typing import Any
 
-from app.services.agents.base import call_llm_with_tools
-from app.services.agents.tool_definitions import TOOL_DEFINITIONS
+import orjson
+
+from app.services.agents.base import LLMError, acall_llm, call_llm_with_tools, stream_llm_with_tools
+from app.services.agents.tool_definitions import PARALLEL_SAFE_TOOLS, TOOL_DEFINITIONS
 from app.services.agents.tool_executor import execute_tool
 
 logger = logging.getLogger(__name__)
 
-SYSTEM_PROMPT_TEMPLATE = (
+# System prompts are kept free of per-request values so the prompt prefix (tools +
+# system prompt + history) is byte-identical across calls and hits the provider's
+# prompt cache. The current time is sent as a separate message after the history.
+SYSTEM_PROMPT = (
     "You are SaturdAI, a friendly and helpful personal assistant. "
     "You help users manage their email, calendar, and subscriptions.\n\n"
-    "Current date and time: {current_datetime}\n\n"
     "You have access to tools for:\n"
     "- Sending emails\n"
     "- Searching and reading emails\n"
@@ -33,10 +42,9 @@ SYSTEM_PROMPT_TEMPLATE = (
     "- If you're unsure about something, ask the user for clarification rather than guessing."
 )
 
-VOICE_SYSTEM_PROMPT_TEMPLATE = (
+VOICE_SYSTEM_PROMPT = (
     "You are SaturdAI, a friendly and concise voice assistant. "
     "The user is speaking to you through a voice interface.\n\n"
-    "Current date and time: {current_datetime}\n\n"
     "You have access to tools for managing email, calendar, and subscriptions.\n\n"
     "Guidelines:\n"
     "- Keep responses brief (1-3 sentences) and conversational.\n"
@@ -45,6 +53,9 @@ VOICE_SYSTEM_PROMPT_TEMPLATE = (
     "- Use the tools when the user asks to perform an action."
 )
 
+SYSTEM_MESSAGE: dict[str, Any] = {"role": "system", "content": SYSTEM_PROMPT}
+VOICE_SYSTEM_MESSAGE: dict[str, Any] = {"role": "system", "content": VOICE_SYSTEM_PROMPT}
+
 
 @dataclass
 class AgentResponse:
@@ -53,6 +64,131 @@ class AgentResponse:
     conversation: list[dict[str, Any]] = field(default_factory=list)
 
 
+_AGENT_ERROR_MESSAGE = "I'm sorry, I encountered an error processing your request. Please try again."
+
+_MAX_HISTORY_MESSAGES = 20
+
+# Turns that fall out of the history window are folded into a summary that is sent as one
+# system message ahead of the remaining history, so long chats keep their context at a
+# bounded prompt size. Summaries cover whole blocks of old messages and are cached by a
+# hash of the messages they cover, so one summary serves several turns and is only
+# regenerated when another block leaves the window. They stay server-side and are never
+# returned in the conversation.
+_COMPACTION_BLOCK = 10
+_MAX_SUMMARY_CACHE_ENTRIES = 1024
+_SUMMARY_PREFIX = "Earlier conversation summary: "
+COMPACTION_SYSTEM_PROMPT = (
+    "You maintain a running summary of a conversation between a user and SaturdAI, "
+    "their email and calendar assistant. Given the previous summary and the messages "
+    "that follow it, write an updated summary. Keep names, dates, decisions, and open "
+    "requests; drop pleasantries. Reply with at most 5 short sentences of plain text."
+)
+
+_summary_cache: dict[str, str] = {}
+
+
+@dataclass(slots=True)
+class _CompactionJob:
+    cache_key: str
+    previous_summary: str | None
+    messages: list[dict[str, Any]]
+
+
+def _block_keys(history: list[dict[str, Any]], message_count: int) -> list[str]:
+    """Hash each block-aligned prefix of the first message_count messages in one pass."""
+    digest = hashlib.blake2b(digest_size=16)
+    keys = []
+    for index, message in enumerate(history[:message_count], start=1):
+        digest.update(orjson.dumps([message.get("role"), message.get("content")]))
+        if index % _COMPACTION_BLOCK == 0:
+            keys.append(digest.hexdigest())
+    return keys
+
+
+def _plan_compaction(
+    history: list[dict[str, Any]],
+) -> tuple[str | None, list[dict[str, Any]], _CompactionJob | None]:
+    """Return (cached summary, messages to send after it, compaction job if it is stale).
+
+    The summary is the newest cached one covering a prefix of the history. Messages it
+    does not cover are sent as-is, and when blocks past the window are still unsummarized
+    a job is returned to fold them in for the following turns.
+    """
+    summarizable = max(0, len(history) - _MAX_HISTORY_MESSAGES) // _COMPACTION_BLOCK * _COMPACTION_BLOCK
+    keys = _block_keys(history, summarizable)
+
+    summary = None
+    summarized = 0
+    for block_count in range(len(keys), 0, -1):
+        summary = _summary_cache.get(keys[block_count - 1])
+        if summary is not None:
+            summarized = block_count * _COMPACTION_BLOCK
+            break
+
+    if summarized == summarizable:
+        return summary, history[summarized:], None
+    return summary, history[summarized:], _CompactionJob(keys[-1], summary, history[summarized:summarizable])
+
+
+def _remember_summary(cache_key: str, summary: str) -> None:
+    if len(_summary_cache) >= _MAX_SUMMARY_CACHE_ENTRIES:
+        # Dicts preserve insertion order, so this drops the oldest entry.
+        _summary_cache.pop(next(iter(_summary_cache)))
+    _summary_cache[cache_key] = summary
+
+
+async def _compact_history(job: _CompactionJob) -> None:
+    """Fold the job's messages into the running summary and cache it; keeps the old one on failure."""
+    transcript = orjson.dumps({
+        "previous_summary": job.previous_summary or "",
+        "messages": [
+            {"role": message.get("role"), "content": message["content"]}
+            for message in job.messages
+            if message.get("content")
+        ],
+    }).decode()
+    try:
+        summary = await acall_llm(COMPACTION_SYSTEM_PROMPT, transcript, max_tokens=300)
+    except LLMError as e:
+        logger.warning("Conversation compaction failed: %s", e)
+        return
+    _remember_summary(job.cache_key, summary.strip())
+
+
+@lru_cache(maxsize=4)
+def _current_datetime_message(epoch_minute: int) -> str:
+    """Format the time line once per minute; every request in that minute reuses it."""
+    minute_start = datetime.fromtimestamp(epoch_minute * 60, tz=timezone.utc)
+    return f"Current date and time: {minute_start.strftime('%A, %B %d, %Y at %I:%M %p UTC')}"
+
+
+def _build_messages(
+    user_message: str,
+    summary: str | None,
+    recent_history: list[dict[str, Any]],
+    voice_mode: bool,
+) -> list[dict[str, Any]]:
+    return [
+        VOICE_SYSTEM_MESSAGE if voice_mode else SYSTEM_MESSAGE,
+        *([{"role": "system", "content": _SUMMARY_PREFIX + summary}] if summary else []),
+        *recent_history,
+        {"role": "system", "content": _current_datetime_message(int(time.time()) // 60)},
+        {"role": "user", "content": user_message},
+    ]
+
+
+def _updated_conversation(
+    user_message: str,
+    response_text: str,
+    history: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    return [
+        *history,
+        {"role": "user", "content": user_message},
+        {"role": "assistant", "content": response_text},
+    ]
+
+
 async def run_agent(
     user_message: str,
     access_token: str,
@@ -63,48 +199,98 @@ async def run_agent(
 
     Returns an AgentResponse with the final text, tool call log, and updated conversation.
     """
-    now = datetime.now(timezone.utc)
-    current_datetime = now.strftime("%A, %B %d, %Y at %I:%M %p UTC")
+    history = conversation_history or []
+    summary, recent_history, compaction_job = _plan_compaction(history)
+    messages = _build_messages(user_message, summary, recent_history, voice_mode)
+    # A stale summary is refreshed alongside the agent call and cached for the next turn,
+    # so it adds no latency; this turn sends the not-yet-summarized messages as-is.
+    compaction = asyncio.create_task(_compact_history(compaction_job)) if compaction_job else None
 
-    template = VOICE_SYSTEM_PROMPT_TEMPLATE if voice_mode else SYSTEM_PROMPT_TEMPLATE
-    system_prompt = template.format(current_datetime=current_datetime)
+    async def bound_tool_executor(tool_name: str, arguments: dict) -> dict:
+        return await execute_tool(tool_name, arguments, access_token)
 
-    messages: list[dict[str, Any]] = [
-        {"role": "system", "content": system_prompt},
-    ]
+    try:
+        try:
+            response_text, tool_call_log = await call_llm_with_tools(
+                messages=messages,
+                tools=TOOL_DEFINITIONS,
+                tool_executor=bound_tool_executor,
+                max_tokens=1000,
+                parallel_tools=PARALLEL_SAFE_TOOLS,
+            )
+        except LLMError as e:
+            logger.warning("Function-calling agent failed: %s", e)
+            return AgentResponse(
+                response_text=_AGENT_ERROR_MESSAGE,
+                tool_calls=[],
+                conversation=[],
+            )
 
-    if conversation_history:
-        trimmed_history = conversation_history[-20:]
-        messages.extend(trimmed_history)
+        if compaction is not None:
+            await compaction
+        return AgentResponse(
+            response_text=response_text,
+            tool_calls=tool_call_log,
+            conversation=_updated_conversation(user_message, response_text, history),
+        )
+    finally:
+        # No-op once compaction has finished; stops it on errors and cancelled requests.
+        if compaction is not None:
+            compaction.cancel()
+
+
+async def stream_agent(
+    user_message: str,
+    access_token: str,
+    conversation_history: list[dict[str, Any]] | None = None,
+    voice_mode: bool = False,
+) -> AsyncIterator[dict[str, Any]]:
+    """Streaming variant of run_agent.
 
-    messages.append({"role": "user", "content": user_message})
+    Yields "text" and "tool_call" events as they happen, then one "done" event carrying the
+    same fields as AgentResponse (or an "error" event if the agent fails).
+    """
+    history = conversation_history or []
+    summary, recent_history, compaction_job = _plan_compaction(history)
+    messages = _build_messages(user_message, summary, recent_history, voice_mode)
+    # A stale summary is refreshed alongside the agent call and cached for the next turn,
+    # so it adds no latency; this turn sends the not-yet-summarized messages as-is.
+    compaction = asyncio.create_task(_compact_history(compaction_job)) if compaction_job else None
 
     async def bound_tool_executor(tool_name: str, arguments: dict) -> dict:
         return await execute_tool(tool_name, arguments, access_token)
 
+    text_parts: list[str] = []
+    tool_call_log: list[dict[str, Any]] = []
     try:
-        response_text, tool_call_log = await call_llm_with_tools(
-            messages=messages,
-            tools=TOOL_DEFINITIONS,
-            tool_executor=bound_tool_executor,
-            max_tokens=1000,
-        )
-    except Exception:
-        logger.exception("Function-calling agent failed")
-        return AgentResponse(
-            response_text="I'm sorry, I encountered an error processing your request. Please try again.",
-            tool_calls=[],
-            conversation=[],
-        )
+        try:
+            async for event in stream_llm_with_tools(
+                messages=messages,
+                tools=TOOL_DEFINITIONS,
+                tool_executor=bound_tool_executor,
+                max_tokens=1000,
+                parallel_tools=PARALLEL_SAFE_TOOLS,
+            ):
+                if event["type"] == "text":
+                    text_parts.append(event["delta"])
+                else:
+                    tool_call_log.append({key: value for key, value in event.items() if key != "type"})
+                yield event
+        except LLMError as e:
+            logger.warning("Streaming function-calling agent failed: %s", e)
+            yield {"type": "error", "message": _AGENT_ERROR_MESSAGE}
+            return
 
-    updated_conversation = []
-    if conversation_history:
-        updated_conversation.extend(conversation_history[-20:])
-    updated_conversation.append({"role": "user", "content": user_message})
-    updated_conversation.append({"role": "assistant", "content": response_text})
-
-    return AgentResponse(
-        response_text=response_text,
-        tool_calls=tool_call_log,
-        conversation=updated_conversation,
-    )
+        if compaction is not None:
+            await compaction
+        response_text = "".join(text_parts)
+        yield {
+            "type": "done",
+            "response": response_text,
+            "tool_calls": tool_call_log,
+            "conversation": _updated_conversation(user_message, response_text, history),
+        }
+    finally:
+        # No-op once compaction has finished; stops it on errors and client disconnects.
+        if compaction is not None:
+            compaction.cancel()
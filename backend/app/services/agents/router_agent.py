@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import copy
 import logging
+from typing import Literal
 
-from app.services.agents.base import call_llm_json
+from pydantic import BaseModel
+
+from app.services.agents.base import LLMError, acall_llm_json
 
 logger = logging.getLogger(__name__)
 
@@ -45,15 +49,101 @@ For search_emails, extract these parameters:
 If the command is unclear, set confidence < 0.5 and action to "unknown"."""
 
 
-def route_command(command: str) -> dict:
+class RouteParameters(BaseModel):
+    summary: str | None
+    date: str | None
+    start_time: str | None
+    end_time: str | None
+    description: str | None
+    query: str | None
+
+
+class RouteResult(BaseModel):
+    action: Literal[
+        "summarize_emails",
+        "suggest_replies",
+        "track_subscriptions",
+        "summarize_thread",
+        "add_to_calendar",
+        "generate_todos",
+        "fetch_recent",
+        "search_emails",
+        "unknown",
+    ]
+    parameters: RouteParameters
+    confidence: float
+    message: str
+
+
+# Routing results for commands seen before, keyed by the normalized command, so
+# repeats like "summarize my emails" skip the LLM. add_to_calendar is not cached:
+# its parameters hold a date resolved from words like "tomorrow" that go stale.
+_MAX_ROUTE_CACHE_ENTRIES = 1024
+_CACHEABLE_ACTIONS = frozenset({
+    "summarize_emails",
+    "suggest_replies",
+    "track_subscriptions",
+    "summarize_thread",
+    "generate_todos",
+    "fetch_recent",
+    "search_emails",
+})
+_route_cache: dict[str, dict] = {}
+
+
+def _route_cache_key(command: str) -> str:
+    return " ".join(command.casefold().split()).rstrip(".!?")
+
+
+def _cached_route(command: str) -> dict | None:
+    # Callers may mutate the routing they get back, so hand out a copy of the cached entry.
+    cached = _route_cache.get(_route_cache_key(command))
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def _remember_route(command: str, routing: dict) -> None:
+    if routing.get("action") not in _CACHEABLE_ACTIONS:
+        return
+    if len(_route_cache) >= _MAX_ROUTE_CACHE_ENTRIES:
+        # Dicts preserve insertion order, so this drops the oldest entry.
+        _route_cache.pop(next(iter(_route_cache)))
+    _route_cache[_route_cache_key(command)] = copy.deepcopy(routing)
+
+
+def _without_unset_parameters(routing: dict) -> dict:
+    # Structured outputs send every parameter, with null for the ones that do not apply
+    # to the action; drop those so callers' .get() defaults still take effect.
+    parameters = routing.get("parameters")
+    if isinstance(parameters, dict):
+        routing["parameters"] = {key: value for key, value in parameters.items() if value is not None}
+    return routing
+
+
+def _unknown_command() -> dict:
+    return {
+        "action": "unknown",
+        "parameters": {},
+        "confidence": 0.0,
+        "message": "I couldn't understand that command.",
+    }
+
+
+async def aroute_command(command: str) -> dict:
     """Route a natural language command to an action."""
+    cached = _cached_route(command)
+    if cached is not None:
+        return cached
+
     try:
-        return call_llm_json(SYSTEM_PROMPT, f"User command: {command}", max_tokens=300)
-    except Exception:
-        logger.exception("Command routing failed")
-        return {
-            "action": "unknown",
-            "parameters": {},
-            "confidence": 0.0,
-            "message": "I couldn't understand that command.",
-        }
+        routing = await acall_llm_json(
+            SYSTEM_PROMPT,
+            f"User command: {command}",
+            max_tokens=300,
+            response_model=RouteResult,
+        )
+    except LLMError as e:
+        logger.warning("Command routing failed: %s", e)
+        return _unknown_command()
+    routing = _without_unset_parameters(routing)
+    _remember_route(command, routing)
+    return routing
@@ -133,6 +133,15 @@ TOOL_DEFINITIONS: list[dict] = [
     },
 ]
 
-TOOL_NAMES: set[str] = {
+TOOL_NAMES: frozenset[str] = frozenset(
     tool["function"]["name"] for tool in TOOL_DEFINITIONS
-}
+)
+
+# Read-only tools that only fetch from Google APIs; several of these requested in one
+# assistant turn can run concurrently. Tools that send or create stay sequential.
+PARALLEL_SAFE_TOOLS: frozenset[str] = frozenset({
+    "search_emails",
+    "get_email_summary",
+    "list_calendar_events",
+    "get_subscriptions",
+})
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -10,14 +9,20 @@ from typing import Any
 from app.services.gmail import fetch_messages, list_messages, send_reply
 from app.services.calendar import create_event, list_events
 from app.services.agents.email_agent import (
-    categorize_emails,
-    create_tldr_digest,
-    detect_subscriptions,
+    acategorize_emails,
+    acreate_tldr_digest,
+    adetect_subscriptions,
 )
 from app.services.agents.date_parsing import parse_flexible_datetime
 
 logger = logging.getLogger(__name__)
 
+# Tool results are sent back to the model verbatim, so free-text event fields are
+# bounded; one event with pasted meeting notes should not bloat the whole turn.
+_MAX_EVENT_TITLE_CHARS = 200
+_MAX_EVENT_LOCATION_CHARS = 128
+_MAX_EVENT_DESCRIPTION_CHARS = 200
+
 
 def _format_gmail_message(msg) -> dict:
     return {
@@ -67,7 +72,7 @@ async def _execute_search_emails(arguments: dict, access_token: str) -> dict:
 
     messages = await fetch_messages(access_token, message_ids, include_body=True)
     email_dicts = [_format_gmail_message(message) for message in messages]
-    categorized = await asyncio.to_thread(categorize_emails, email_dicts)
+    categorized = await acategorize_emails(email_dicts)
 
     return {"success": True, "data": {"emails": categorized, "count": len(categorized)}}
 
@@ -95,7 +100,7 @@ async def _execute_get_email_summary(arguments: dict, access_token: str) -> dict
         if not message.is_automated_sender
     ]
 
-    digest = await asyncio.to_thread(create_tldr_digest, email_dicts)
+    digest = await acreate_tldr_digest(email_dicts)
     return {"success": True, "data": digest}
 
 
@@ -169,16 +174,14 @@ async def _execute_list_calendar_events(arguments: dict, access_token: str) -> d
     for event in events:
         serialized_events.append({
             "event_id": event.id,
-            "summary": event.summary,
+            "summary": (event.summary or "")[:_MAX_EVENT_TITLE_CHARS] or None,
             "start": event.start.isoformat(),
             "end": event.end.isoformat(),
             "duration_minutes": event.duration_minutes,
-            "location": event.location,
-            "description": (event.description or "")[:200],
+            "location": (event.location or "")[:_MAX_EVENT_LOCATION_CHARS] or None,
+            "description": (event.description or "")[:_MAX_EVENT_DESCRIPTION_CHARS],
             "organizer_email": event.organizer_email,
-            "attendee_count": len([
-                attendee for attendee in event.attendees if not attendee.is_resource
-            ]),
+            "attendee_count": sum(not attendee.is_resource for attendee in event.attendees),
             "is_recurring": event.is_recurring,
         })
 
@@ -206,7 +209,7 @@ async def _execute_get_subscriptions(arguments: dict, access_token: str) -> dict
 
     messages = await fetch_messages(access_token, message_ids, include_body=True)
     email_dicts = [_format_gmail_message(message) for message in messages]
-    subscriptions = await asyncio.to_thread(detect_subscriptions, email_dicts)
+    subscriptions = await adetect_subscriptions(email_dicts)
 
     return {
         "success": True,
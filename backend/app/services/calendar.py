@@ -1,29 +1,25 @@
 from __future__ import annotations
 
 import asyncio
-import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
 from dateutil.parser import parse as parse_datetime
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-
-# Patterns for detecting calendar resources (rooms, etc.)
-RESOURCE_PATTERNS = [
-    r"room",
-    r"conf\s*room",
-    r"conference",
-    r"meeting\s*room",
-    r"resource",
-    r"boardroom",
-    r"huddle",
-]
-RESOURCE_REGEX = re.compile("|".join(RESOURCE_PATTERNS), re.IGNORECASE)
-
-
-@dataclass
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+# Substrings that mark a calendar resource (rooms, etc.). "room" also covers
+# "conf room", "meeting room" and "boardroom", and "resource" covers the
+# "resource-..." and "..._resource@" address forms, so plain substring checks on
+# the lowercased email and name replace a regex scan per attendee.
+RESOURCE_KEYWORDS = ("room", "conference", "resource", "huddle")
+
+
+@dataclass(slots=True)
 class CalendarAttendee:
     email: str
     name: Optional[str]
@@ -32,7 +28,7 @@ class CalendarAttendee:
     is_resource: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     id: str
     summary: Optional[str]
@@ -59,14 +55,7 @@ def is_resource_attendee(attendee: dict) -> bool:
     email = attendee.get("email", "").lower()
     name = attendee.get("displayName", "").lower()
 
-    if RESOURCE_REGEX.search(email) or RESOURCE_REGEX.search(name):
-        return True
-
-    # Common resource email patterns
-    if email.startswith("resource-") or "_resource@" in email:
-        return True
-
-    return False
+    return any(keyword in email or keyword in name for keyword in RESOURCE_KEYWORDS)
 
 
 def parse_attendees(attendees_data: list) -> list[CalendarAttendee]:
@@ -95,10 +84,19 @@ def parse_event_datetime(dt_data: dict) -> datetime:
     return datetime.now(timezone.utc)
 
 
+@lru_cache(maxsize=1)
+def _calendar_discovery_document() -> str:
+    """Read the bundled Calendar discovery document once per process."""
+    return get_static_doc("calendar", "v3")
+
+
 def build_calendar_service(access_token: str) -> Any:
     """Build a Calendar API service object."""
     credentials = Credentials(token=access_token)
-    return build("calendar", "v3", credentials=credentials)
+    # Services are built per call because they are not safe to share across the
+    # worker threads the API calls run on. build_from_document mutates the schema dict it
+    # is given, so each build parses its own copy of the cached document text.
+    return build_from_document(orjson.loads(_calendar_discovery_document()), credentials=credentials)
 
 
 async def list_events(
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 from uuid import UUID as UUIDType
 
 import httpx
-from sqlalchemy import select, text
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.env import load_settings
 from app.db.models import EmailEmbedding
-from app.services.agents.base import call_llm
+from app.services.agents.base import acall_llm, get_async_http_client
 from app.services.gmail import fetch_messages, list_messages
 
 settings = load_settings()
@@ -21,61 +22,80 @@ logger = logging.getLogger(__name__)
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 1536
 BATCH_SIZE = 100
+MAX_CONCURRENT_EMBEDDING_BATCHES = 5
+MAX_CONCURRENT_GMAIL_FETCHES = 2
 MAX_EMAILS_TO_INDEX = 500
 SEARCH_TOP_K = 10
 
+# Process-wide limits: they bound in-flight embedding calls and Gmail full fetches
+# across every caller, not just within one indexing run.
+_embedding_semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_BATCHES)
+_gmail_fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_GMAIL_FETCHES)
 
-def generate_embedding(text_input: str) -> list[float]:
-    """Generate a single embedding vector via OpenAI."""
+
+EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+
+
+def _embedding_headers() -> dict[str, str]:
     if not settings.openai_api_key:
         raise ValueError("OPENAI_API_KEY not configured")
+    return {
+        "Authorization": f"Bearer {settings.openai_api_key}",
+        "Content-Type": "application/json",
+    }
 
-    with httpx.Client(timeout=30) as client:
-        response = client.post(
-            "https://api.openai.com/v1/embeddings",
-            headers={
-                "Authorization": f"Bearer {settings.openai_api_key}",
-                "Content-Type": "application/json",
-            },
+
+async def generate_embedding(text_input: str) -> list[float]:
+    """Generate a single embedding vector via OpenAI."""
+    response = await get_async_http_client().post(
+        EMBEDDINGS_URL,
+        headers=_embedding_headers(),
+        json={
+            "model": EMBEDDING_MODEL,
+            "input": text_input,
+        },
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()["data"][0]["embedding"]
+
+
+async def _embed_batch(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    batch: list[str],
+) -> list[list[float]]:
+    async with _embedding_semaphore:
+        response = await client.post(
+            EMBEDDINGS_URL,
+            headers=headers,
             json={
                 "model": EMBEDDING_MODEL,
-                "input": text_input,
+                "input": batch,
             },
         )
-        response.raise_for_status()
-        return response.json()["data"][0]["embedding"]
+    response.raise_for_status()
+    data = response.json()["data"]
+    sorted_data = sorted(data, key=lambda item: item["index"])
+    return [item["embedding"] for item in sorted_data]
 
 
-def generate_embeddings_batch(texts: list[str]) -> list[list[float]]:
-    """Generate embeddings for a batch of texts in a single API call."""
-    if not settings.openai_api_key:
-        raise ValueError("OPENAI_API_KEY not configured")
+async def generate_embeddings_batch(texts: list[str]) -> list[list[float]]:
+    """Generate embeddings for texts, sending up to BATCH_SIZE texts per API call."""
+    headers = _embedding_headers()
 
     if not texts:
         return []
 
-    all_embeddings: list[list[float]] = []
-
-    with httpx.Client(timeout=60) as client:
-        for offset in range(0, len(texts), BATCH_SIZE):
-            batch = texts[offset : offset + BATCH_SIZE]
-            response = client.post(
-                "https://api.openai.com/v1/embeddings",
-                headers={
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": EMBEDDING_MODEL,
-                    "input": batch,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()["data"]
-            sorted_data = sorted(data, key=lambda item: item["index"])
-            all_embeddings.extend([item["embedding"] for item in sorted_data])
-
-    return all_embeddings
+    # Batches are independent, so they go out concurrently on the shared pooled
+    # client; the shared semaphore keeps a large backlog from tripping OpenAI rate limits.
+    client = get_async_http_client()
+    batch_embeddings = await asyncio.gather(*(
+        _embed_batch(client, headers, texts[offset : offset + BATCH_SIZE])
+        for offset in range(0, len(texts), BATCH_SIZE)
+    ))
+    # gather returns results in submission order, so input order is preserved.
+    return [embedding for batch in batch_embeddings for embedding in batch]
 
 
 def _build_embedding_text(
@@ -95,6 +115,41 @@ def _build_embedding_text(
     return " | ".join(parts)
 
 
+async def _fetch_and_embed(
+    access_token: str,
+    gmail_ids: list[str],
+) -> tuple[list[dict[str, Any]], list[list[float]]]:
+    """Fetch one chunk of messages and embed them; returns (record data, embeddings)."""
+    async with _gmail_fetch_semaphore:
+        messages = await fetch_messages(access_token, gmail_ids, include_body=True)
+
+    message_data: list[dict[str, Any]] = []
+    for message in messages:
+        embedding_text = _build_embedding_text(
+            subject=message.subject,
+            from_name=message.from_name,
+            from_email=message.from_email,
+            body_preview=message.body_preview,
+        )
+        message_data.append({
+            "gmail_message_id": message.id,
+            "thread_id": message.thread_id,
+            "subject": message.subject,
+            "from_email": message.from_email,
+            "from_name": message.from_name,
+            "snippet": message.snippet,
+            "body_preview": (message.body_preview or "")[:5000],
+            "email_date": message.internal_date,
+            "embedding_text": embedding_text,
+        })
+
+    if not message_data:
+        return [], []
+
+    embeddings = await generate_embeddings_batch([data["embedding_text"] for data in message_data])
+    return message_data, embeddings
+
+
 async def index_emails(
     user_id: UUIDType,
     access_token: str,
@@ -125,47 +180,25 @@ async def index_emails(
     if not new_gmail_ids:
         return 0
 
-    messages = await fetch_messages(access_token, new_gmail_ids, include_body=True)
-
-    texts_to_embed: list[str] = []
-    message_data: list[dict[str, Any]] = []
-
-    for message in messages:
-        embedding_text = _build_embedding_text(
-            subject=message.subject,
-            from_name=message.from_name,
-            from_email=message.from_email,
-            body_preview=message.body_preview,
-        )
-        texts_to_embed.append(embedding_text)
-        message_data.append({
-            "gmail_message_id": message.id,
-            "thread_id": message.thread_id,
-            "subject": message.subject,
-            "from_email": message.from_email,
-            "from_name": message.from_name,
-            "snippet": message.snippet,
-            "body_preview": (message.body_preview or "")[:5000],
-            "email_date": message.internal_date,
-            "embedding_text": embedding_text,
-        })
-
-    if not texts_to_embed:
+    # Each chunk is embedded as soon as its Gmail fetch lands, so fetching later chunks
+    # overlaps with embedding earlier ones; _gmail_fetch_semaphore caps how many full
+    # fetches run at once.
+    chunk_results = await asyncio.gather(*(
+        _fetch_and_embed(access_token, new_gmail_ids[offset : offset + BATCH_SIZE])
+        for offset in range(0, len(new_gmail_ids), BATCH_SIZE)
+    ))
+    records = [
+        EmailEmbedding(user_id=user_id, embedding=embedding_vector, **record_data)
+        for message_data, embeddings in chunk_results
+        for record_data, embedding_vector in zip(message_data, embeddings, strict=True)
+    ]
+    if not records:
         return 0
 
-    embeddings = generate_embeddings_batch(texts_to_embed)
-
-    for index, embedding_vector in enumerate(embeddings):
-        record = EmailEmbedding(
-            user_id=user_id,
-            embedding=embedding_vector,
-            **message_data[index],
-        )
-        database.add(record)
-
+    database.add_all(records)
     await database.commit()
-    logger.info("Indexed %d new emails for user %s", len(embeddings), user_id)
-    return len(embeddings)
+    logger.info("Indexed %d new emails for user %s", len(records), user_id)
+    return len(records)
 
 
 async def search_emails(
@@ -177,33 +210,27 @@ async def search_emails(
     """Index new emails, then perform semantic vector search and synthesize results."""
     newly_indexed = await index_emails(user_id, access_token, database)
 
-    query_embedding = generate_embedding(query)
-    embedding_literal = "[" + ",".join(str(value) for value in query_embedding) + "]"
+    query_embedding = await generate_embedding(query)
+    distance = EmailEmbedding.embedding.cosine_distance(query_embedding).label("distance")
 
+    # Binding through the Vector column type lets pgvector encode the query vector and
+    # the planner see a typed vector parameter, instead of a hand-built literal cast
+    # with ::vector on every search.
     results = await database.execute(
-        text(
-            """
-            SELECT
-                gmail_message_id,
-                thread_id,
-                subject,
-                from_email,
-                from_name,
-                snippet,
-                body_preview,
-                email_date,
-                embedding <=> :query_vector::vector AS distance
-            FROM email_embeddings
-            WHERE user_id = :user_id
-            ORDER BY embedding <=> :query_vector::vector
-            LIMIT :top_k
-            """
-        ),
-        {
-            "query_vector": embedding_literal,
-            "user_id": str(user_id),
-            "top_k": SEARCH_TOP_K,
-        },
+        select(
+            EmailEmbedding.gmail_message_id,
+            EmailEmbedding.thread_id,
+            EmailEmbedding.subject,
+            EmailEmbedding.from_email,
+            EmailEmbedding.from_name,
+            EmailEmbedding.snippet,
+            EmailEmbedding.body_preview,
+            EmailEmbedding.email_date,
+            distance,
+        )
+        .where(EmailEmbedding.user_id == user_id)
+        .order_by(distance)
+        .limit(SEARCH_TOP_K)
     )
 
     rows = results.fetchall()
@@ -211,25 +238,30 @@ async def search_emails(
     context_parts = []
 
     for row_index, row in enumerate(rows):
-        email_entry = {
+        subject = row.subject or ""
+        from_email = row.from_email or ""
+        from_name = row.from_name or ""
+        body_preview = row.body_preview or ""
+        email_date = row.email_date.isoformat() if row.email_date else ""
+
+        email_results.append({
             "message_id": row.gmail_message_id,
             "thread_id": row.thread_id,
-            "subject": row.subject or "",
-            "from_email": row.from_email or "",
-            "from_name": row.from_name or "",
+            "subject": subject,
+            "from_email": from_email,
+            "from_name": from_name,
             "snippet": row.snippet or "",
-            "body_preview": row.body_preview or "",
-            "date": row.email_date.isoformat() if row.email_date else "",
+            "body_preview": body_preview,
+            "date": email_date,
             "relevance_score": round(1 - row.distance, 4),
-        }
-        email_results.append(email_entry)
+        })
 
         context_parts.append(
             f"Email {row_index + 1}:\n"
-            f"  Subject: {email_entry['subject']}\n"
-            f"  From: {email_entry['from_name'] or email_entry['from_email']}\n"
-            f"  Date: {email_entry['date']}\n"
-            f"  Preview: {email_entry['body_preview'][:500]}\n"
+            f"  Subject: {subject}\n"
+            f"  From: {from_name or from_email}\n"
+            f"  Date: {email_date}\n"
+            f"  Preview: {body_preview[:500]}\n"
         )
 
     if not email_results:
@@ -248,7 +280,7 @@ async def search_emails(
         "If the results don't seem relevant to the query, say so honestly."
     )
 
-    summary = call_llm(
+    summary = await acall_llm(
         system_prompt="You are a helpful email assistant. Summarize search results clearly and concisely.",
         user_prompt=synthesis_prompt,
         max_tokens=500,
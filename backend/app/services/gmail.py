@@ -3,17 +3,22 @@ from __future__ import annotations
 import asyncio
 import base64
 import email
+import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
-from googleapiclient.discovery import build
+import orjson
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from google.oauth2.credentials import Credentials
 
 from app.core.env import load_settings
 
 settings = load_settings()
+logger = logging.getLogger(__name__)
 
 # Patterns for noise detection
 AUTOMATED_SENDER_PATTERNS = [
@@ -37,7 +42,7 @@ AUTOMATED_SENDER_REGEX = re.compile(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class GmailMessage:
     id: str
     thread_id: str
@@ -157,10 +162,19 @@ def has_header(headers: list, name: str) -> bool:
     return any(h.get("name", "").lower() == name.lower() for h in headers)
 
 
+@lru_cache(maxsize=1)
+def _gmail_discovery_document() -> str:
+    """Read the bundled Gmail discovery document once per process."""
+    return get_static_doc("gmail", "v1")
+
+
 def build_gmail_service(access_token: str) -> Any:
     """Build a Gmail API service object."""
     credentials = Credentials(token=access_token)
-    return build("gmail", "v1", credentials=credentials)
+    # Services are built per call because they are not safe to share across the
+    # worker threads the API calls run on. build_from_document mutates the schema dict it
+    # is given, so each build parses its own copy of the cached document text.
+    return build_from_document(orjson.loads(_gmail_discovery_document()), credentials=credentials)
 
 _GMAIL_METADATA_HEADERS = [
     "From",
@@ -365,7 +379,10 @@ async def fetch_messages(
             response: dict | None,
             exception: Exception | None,
         ) -> None:
-            if exception is not None or not isinstance(response, dict):
+            if exception is not None:
+                logger.warning("Gmail batch fetch failed for request %s: %s", request_id, exception)
+                return
+            if not isinstance(response, dict):
                 return
             parsed = _parse_gmail_message(msg=response, include_body=include_body)
             if parsed is not None:
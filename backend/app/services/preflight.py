@@ -44,12 +44,12 @@ async def check_coverage(access_token: str) -> PreflightResult:
     try:
         email_count = await count_primary_messages(access_token)
     except Exception as e:
-        logger.warning(f"Failed to count emails during preflight: {e}")
+        logger.warning("Failed to count emails during preflight: %s", e)
 
     try:
         event_count = await count_events(access_token, window_start, now)
     except Exception as e:
-        logger.warning(f"Failed to count events during preflight: {e}")
+        logger.warning("Failed to count events during preflight: %s", e)
 
     # Check thresholds
     if email_count < MIN_PRIMARY_EMAILS and event_count < MIN_CALENDAR_EVENTS:
@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import decrypt_token, encrypt_token
 from app.db.engine import async_session_maker
 from app.db.models import Todo, User
-from app.services.agents.email_agent import extract_todos
+from app.services.agents.email_agent import aextract_todos
 from app.services.gmail import fetch_messages, list_messages
 from app.services.google_oauth import refresh_access_token
 
@@ -89,7 +89,7 @@ async def _sync_todos_for_user(user: User, db: AsyncSession) -> None:
     if not email_dicts:
         return
 
-    todos_result = await asyncio.to_thread(extract_todos, email_dicts)
+    todos_result = await aextract_todos(email_dicts)
     raw_todos = todos_result.get("todos", [])
 
     for raw_todo in raw_todos: